@@ -91,6 +91,47 @@ class PrepareVina:
         # Fallback to OpenBabel
         return self._pdb_to_pdbqt_obabel(pdb_file, output_file)
 
+    def pdb_to_pdbqt_str(self, pdb_file: Path, molecule_type: str = "auto") -> bytes:
+        """
+        Convert PDB file to PDBQT without writing it to disk.
+
+        Same routing as pdb_to_pdbqt (Meeko for ligands, OpenBabel for receptors
+        and as fallback), but the PDBQT is returned instead of written.
+
+        Args:
+            pdb_file: Path to input PDB (or SDF) file.
+            molecule_type: Type of molecule ("receptor", "ligand", "auto").
+
+        Returns:
+            PDBQT content as bytes.
+
+        Raises:
+            RuntimeError: If conversion fails.
+        """
+        pdb_file = Path(pdb_file)
+
+        logger.info(f"Converting {pdb_file} to in-memory PDBQT (pH={self.ph})")
+
+        if self.use_meeko and self.meeko_available and molecule_type != "receptor":
+            try:
+                return self._meeko_pdbqt_string(pdb_file).encode()
+            except Exception as e:
+                logger.warning(f"Meeko conversion failed: {e}. Falling back to OpenBabel.")
+
+        try:
+            result = subprocess.run(
+                self._obabel_command(pdb_file, ["-opdbqt"]),
+                check=True,
+                capture_output=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"OpenBabel conversion failed: {e.stderr.decode(errors='replace')}")
+        except FileNotFoundError:
+            raise RuntimeError("obabel not found. Please install OpenBabel via apt-get or conda.")
+        if not result.stdout:
+            raise RuntimeError(f"OpenBabel produced no PDBQT output for {pdb_file}")
+        return result.stdout
+
     def _pdb_to_pdbqt_meeko(self, pdb_file: Path, output_file: Path, molecule_type: str) -> Path:
         """
         Convert PDB to PDBQT using Meeko (better charge assignment).
@@ -103,33 +144,8 @@ class PrepareVina:
         Returns:
             Path to output PDBQT.
         """
-        from meeko import MoleculePreparation
-        from rdkit import Chem
-
-        logger.info(f"Using Meeko for enhanced preparation (pH={self.ph})")
-
         try:
-            # Read molecule based on extension (support PDB and SDF formats)
-            if pdb_file.suffix.lower() == ".sdf":
-                suppl = Chem.SDMolSupplier(str(pdb_file), removeHs=False)
-                mol = next(iter(suppl)) if suppl else None
-                if mol is None or len(suppl) == 0:
-                    raise RuntimeError(f"RDKit failed to parse SDF: {pdb_file}")
-                logger.info(f"✓ SDF file loaded successfully")
-            else:
-                mol = Chem.MolFromPDBFile(str(pdb_file), removeHs=False)
-                if mol is None:
-                    raise RuntimeError(f"RDKit failed to parse PDB: {pdb_file}")
-
-            if Chem.AddHs(mol) is not None:
-                mol = Chem.AddHs(mol, addCoords=True)
-
-            # Prepare with Meeko
-            preparator = MoleculePreparation()
-            preparator.prepare(mol)
-
-            # Write PDBQT
-            pdbqt_string = preparator.write_pdbqt_string()
+            pdbqt_string = self._meeko_pdbqt_string(pdb_file)
 
             with open(output_file, "w") as f:
                 f.write(pdbqt_string)
@@ -140,6 +156,46 @@ class PrepareVina:
         except Exception as e:
             raise RuntimeError(f"Meeko preparation failed: {e}")
 
+    def _meeko_pdbqt_string(self, pdb_file: Path) -> str:
+        """Run RDKit + Meeko on a PDB/SDF file and return the PDBQT text."""
+        from meeko import MoleculePreparation
+        from rdkit import Chem
+
+        logger.info(f"Using Meeko for enhanced preparation (pH={self.ph})")
+
+        # Read molecule based on extension (support PDB and SDF formats)
+        if pdb_file.suffix.lower() == ".sdf":
+            suppl = Chem.SDMolSupplier(str(pdb_file), removeHs=False)
+            mol = next(iter(suppl)) if suppl else None
+            if mol is None or len(suppl) == 0:
+                raise RuntimeError(f"RDKit failed to parse SDF: {pdb_file}")
+            logger.info(f"✓ SDF file loaded successfully")
+        else:
+            mol = Chem.MolFromPDBFile(str(pdb_file), removeHs=False)
+            if mol is None:
+                raise RuntimeError(f"RDKit failed to parse PDB: {pdb_file}")
+
+        if Chem.AddHs(mol) is not None:
+            mol = Chem.AddHs(mol, addCoords=True)
+
+        # Prepare with Meeko
+        preparator = MoleculePreparation()
+        preparator.prepare(mol)
+        return preparator.write_pdbqt_string()
+
+    def _obabel_command(self, pdb_file: Path, output_args: list) -> list:
+        """Build the OpenBabel conversion command for the given output arguments."""
+        return [
+            "obabel",
+            str(pdb_file),
+            *output_args,
+            "-xr",
+            "-h",  # Add hydrogens explicitly
+            f"-p{self.ph}",  # Set pH for protonation state
+            "--partialcharge",  # Add partial charge calculation
+            "gasteiger",  # Use Gasteiger-Marsili charges
+        ]
+
     def _pdb_to_pdbqt_obabel(self, pdb_file: Path, output_file: Path) -> Path:
         """
         Convert PDB to PDBQT using OpenBabel (fallback).
@@ -155,17 +211,7 @@ class PrepareVina:
 
         try:
             # Build command with pH and gasteiger charge calculation
-            cmd = [
-                "obabel",
-                str(pdb_file),
-                "-O",
-                str(output_file),
-                "-xr",
-                "-h",  # Add hydrogens explicitly
-                f"-p{self.ph}",  # Set pH for protonation state
-                "--partialcharge",  # Add partial charge calculation
-                "gasteiger",  # Use Gasteiger-Marsili charges
-            ]
+            cmd = self._obabel_command(pdb_file, ["-O", str(output_file)])
 
             result = subprocess.run(
                 cmd,
@@ -1,19 +1,79 @@
 """Vina engine wrapper for CLI usage."""
 
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional
 
 from autoscan.docking.utils import calculate_grid_box
-from autoscan.engine.vina import VinaWrapper
+from autoscan.engine.vina import DockingResult, VinaWrapper
+
+# RAM-backed scratch space for PDBQT passed in as bytes (falls back to the default tempdir)
+_TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
 
 
 class VinaEngine:
     """Minimal Vina engine wrapper for the CLI."""
 
-    def __init__(self, receptor_pdbqt: str, ligand_pdbqt: str, vina_executable: str = "vina"):
+    def __init__(
+        self,
+        receptor_pdbqt: str,
+        ligand_pdbqt: Optional[str] = None,
+        vina_executable: Optional[str] = None,
+        engine: str = "vina",
+        receptor_pdbqt_bytes: Optional[bytes] = None,
+        ligand_pdbqt_bytes: Optional[bytes] = None,
+    ):
+        """
+        Args:
+            receptor_pdbqt: Receptor PDBQT path (or a name for receptor_pdbqt_bytes).
+            ligand_pdbqt: Ligand PDBQT path (or a name for ligand_pdbqt_bytes).
+            vina_executable: Explicit Vina binary; resolved from engine if None.
+            engine: Docking engine ("vina", "qvina2", "smina", "unidock", "auto").
+            receptor_pdbqt_bytes: In-memory receptor PDBQT, staged on tmpfs instead of
+                being read from receptor_pdbqt.
+            ligand_pdbqt_bytes: In-memory ligand PDBQT, staged likewise.
+        """
+        self.vina = VinaWrapper(vina_executable=vina_executable, engine=engine)
+        self._scratch = None
+        if receptor_pdbqt_bytes is not None:
+            receptor_pdbqt = self._stage("receptor", receptor_pdbqt, receptor_pdbqt_bytes)
+        if ligand_pdbqt_bytes is not None:
+            ligand_pdbqt = self._stage("ligand", ligand_pdbqt, ligand_pdbqt_bytes)
         self.receptor_pdbqt = Path(receptor_pdbqt)
+        self.ligand_pdbqt = Path(ligand_pdbqt) if ligand_pdbqt is not None else None
+
+    def _stage(self, role: str, name: str, pdbqt_bytes: bytes) -> Path:
+        """Write in-memory PDBQT to scratch space on tmpfs; removed with the engine."""
+        if self._scratch is None:
+            self._scratch = tempfile.TemporaryDirectory(prefix="autoscan-", dir=_TMPFS_DIR)
+        staged = Path(self._scratch.name) / role / Path(name).with_suffix(".pdbqt").name
+        staged.parent.mkdir(exist_ok=True)
+        staged.write_bytes(pdbqt_bytes)
+        return staged
+
+    def set_ligand(self, ligand_pdbqt: str) -> None:
+        """Point the engine at another ligand, keeping the receptor and verified binary."""
         self.ligand_pdbqt = Path(ligand_pdbqt)
-        self.vina = VinaWrapper(vina_executable=vina_executable)
+
+    @staticmethod
+    def _grid_args(center: list, ligand_mol=None, buffer_angstroms: float = 6.0) -> list:
+        """Build Vina --center_*/--size_* arguments for a pocket center."""
+        grid = calculate_grid_box(center, ligand_mol=ligand_mol, buffer_angstroms=buffer_angstroms)
+        return [
+            "--center_x",
+            str(grid["center_x"]),
+            "--center_y",
+            str(grid["center_y"]),
+            "--center_z",
+            str(grid["center_z"]),
+            "--size_x",
+            str(grid["size_x"]),
+            "--size_y",
+            str(grid["size_y"]),
+            "--size_z",
+            str(grid["size_z"]),
+        ]
 
     def run(
         self,
@@ -27,6 +87,8 @@ class VinaEngine:
         use_consensus: bool = False,
         consensus_method: str = "mean",
         flex_pdbqt: Optional[Path] = None,
+        write_maps: Optional[Path] = None,
+        maps: Optional[Path] = None,
     ):
         """
         Run Vina docking.
@@ -39,25 +101,15 @@ class VinaEngine:
             num_modes: Number of binding modes (default 9).
             exhaustiveness: Search exhaustiveness (default 8, use 32 for deep search).
             output_pdbqt: Output file path.
+            write_maps: Prefix to save the receptor affinity maps under.
+            maps: Prefix of previously written maps for this receptor and box.
 
         Returns:
             Binding affinity in kcal/mol.
         """
-        grid = calculate_grid_box(center, ligand_mol=ligand_mol, buffer_angstroms=buffer_angstroms)
-        grid_args = [
-            "--center_x",
-            str(grid["center_x"]),
-            "--center_y",
-            str(grid["center_y"]),
-            "--center_z",
-            str(grid["center_z"]),
-            "--size_x",
-            str(grid["size_x"]),
-            "--size_y",
-            str(grid["size_y"]),
-            "--size_z",
-            str(grid["size_z"]),
-        ]
+        if self.ligand_pdbqt is None:
+            raise ValueError("No ligand set; pass ligand_pdbqt or call set_ligand() first")
+        grid_args = self._grid_args(center, ligand_mol, buffer_angstroms)
 
         result = self.vina.dock(
             self.receptor_pdbqt,
@@ -70,5 +122,46 @@ class VinaEngine:
             use_consensus=use_consensus,
             consensus_method=consensus_method,
             flex_pdbqt=flex_pdbqt,
+            write_maps=write_maps,
+            maps=maps,
         )
         return result
+
+    def run_batch(
+        self,
+        ligand_pdbqts: List[str],
+        center: list,
+        buffer_angstroms: float = 6.0,
+        cpu: int = 4,
+        num_modes: int = 9,
+        exhaustiveness: int = 8,
+        output_dir: Optional[str] = None,
+    ) -> Iterator[DockingResult]:
+        """
+        Dock many ligands against this receptor with one shared grid box.
+
+        Receptor maps are computed once for the whole batch, through the Vina
+        Python bindings or a single `vina --batch` run (see VinaWrapper.dock_batch).
+
+        Args:
+            ligand_pdbqts: Ligand PDBQT files.
+            center: [x, y, z] center coordinates.
+            buffer_angstroms: Padding around the default box (default 6.0 Å).
+            cpu: Number of CPUs (default 4).
+            num_modes: Number of binding modes (default 9).
+            exhaustiveness: Search exhaustiveness (default 8).
+            output_dir: Directory for docked poses (default: next to each ligand).
+
+        Yields:
+            DockingResult per ligand, in input order.
+        """
+        grid_args = self._grid_args(center, buffer_angstroms=buffer_angstroms)
+        return self.vina.dock_batch(
+            self.receptor_pdbqt,
+            [Path(ligand) for ligand in ligand_pdbqts],
+            grid_args,
+            output_dir=Path(output_dir) if output_dir else None,
+            cpu=cpu,
+            num_modes=num_modes,
+            exhaustiveness=exhaustiveness,
+        )
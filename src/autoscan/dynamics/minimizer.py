@@ -31,10 +31,13 @@ Author: AutoScan Development Team (Module 8 - Upgraded)
 Date: February 2026
 """
 
+import logging
 from pathlib import Path
 from typing import Optional
 import sys
 
+import numpy as np
+
 try:
     from openmm import app
     import openmm as mm
@@ -44,10 +47,39 @@ try:
 except ImportError:
     HAS_OPENMM = False
 
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 from autoscan.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Below this size the Numba compile cost outweighs the gather speedup
+NUMBA_MIN_ATOMS = 50_000
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True)
+    def _pack_backbone(code, pos):
+        """Gather indices and positions of atoms with a non-zero backbone code."""
+        n = code.shape[0]
+        idx = np.empty(n, np.int32)
+        out = np.empty((n, 3), np.float64)
+        k = 0
+        for i in range(n):
+            if code[i] != 0:
+                idx[k] = i
+                out[k, 0] = pos[i, 0]
+                out[k, 1] = pos[i, 1]
+                out[k, 2] = pos[i, 2]
+                k += 1
+        return idx[:k], out[:k]
+
 
 class EnergyMinimizer:
     """
@@ -57,14 +89,22 @@ class EnergyMinimizer:
     (CA, C, N) to control the degree of structural flexibility during relaxation.
     """
 
-    def __init__(self):
+    def __init__(self, grad_tol: float = 1.0):
         """
         Initialize the Force Field and simulation environment.
 
         Uses:
         - Force Field: AMBER14 (amber14-all.xml) for proteins
         - Solvent: Implicit OBC2 (Generalized Born with molecular volume correction)
+
+        Args:
+            grad_tol: RMS force threshold in kJ/mol/nm below which the input is
+                treated as already relaxed and L-BFGS minimization is skipped.
         """
+        self.grad_tol = grad_tol
+        self.forcefield = None
+        self._ready = False
+
         if not HAS_OPENMM:
             logger.warning(
                 "OpenMM not found. Energy minimization will be skipped. "
@@ -79,6 +119,9 @@ class EnergyMinimizer:
             logger.error(f"Failed to load force field: {e}")
             self.forcefield = None
 
+        # Resolved once so minimize() needs a single check per call
+        self._ready = self.forcefield is not None
+
     def minimize(
         self,
         pdb_path: Path,
@@ -112,17 +155,16 @@ class EnergyMinimizer:
             >>> relaxed = minimizer.minimize(Path("mutant.pdb"), stiffness=500.0)
         """
 
-        if not HAS_OPENMM:
-            logger.warning(f"OpenMM not available. Returning original: {pdb_path}")
-            return Path(pdb_path)
-
-        if self.forcefield is None:
-            logger.warning(f"Force field not initialized. Returning original: {pdb_path}")
+        if not self._ready:
+            if not HAS_OPENMM:
+                logger.warning("OpenMM not available. Returning original: %s", pdb_path)
+            else:
+                logger.warning("Force field not initialized. Returning original: %s", pdb_path)
             return Path(pdb_path)
 
         pdb_path = Path(pdb_path)
         if not pdb_path.exists():
-            logger.error(f"PDB file not found: {pdb_path}")
+            logger.error("PDB file not found: %s", pdb_path)
             return pdb_path
 
         # Handle PDBQT conversion
@@ -130,9 +172,9 @@ class EnergyMinimizer:
             pdb_alternative = pdb_path.with_suffix(".pdb")
             if pdb_alternative.exists():
                 pdb_path = pdb_alternative
-                logger.info(f"Using PDB file instead of PDBQT: {pdb_path}")
+                logger.info("Using PDB file instead of PDBQT: %s", pdb_path)
             else:
-                logger.warning(f"PDBQT file provided but PDB not found. Returning original.")
+                logger.warning("PDBQT file provided but PDB not found. Returning original.")
                 return Path(pdb_path)
 
         if output_path is None:
@@ -141,27 +183,31 @@ class EnergyMinimizer:
             output_path = Path(output_path)
 
         try:
-            logger.info(f"Starting energy minimization: {pdb_path.name}")
-            logger.info(f"  Force Field: AMBER14 + OBC2")
-            logger.info(f"  Max Iterations: {max_iterations}")
-            logger.info(f"  Backbone Restraint: {stiffness} kJ/mol/nm²")
-            if stiffness > 0:
-                logger.info(f"  Mode: Restrained (stiffness={stiffness})")
-            else:
-                logger.info(f"  Mode: Unrestrained (full flexibility)")
+            verbose = logger.isEnabledFor(logging.INFO)
+            if verbose:
+                logger.info("Starting energy minimization: %s", pdb_path.name)
+                logger.info("  Force Field: AMBER14 + OBC2")
+                logger.info("  Max Iterations: %d", max_iterations)
+                logger.info("  Backbone Restraint: %s kJ/mol/nm²", stiffness)
+                if stiffness > 0:
+                    logger.info("  Mode: Restrained (stiffness=%s)", stiffness)
+                else:
+                    logger.info("  Mode: Unrestrained (full flexibility)")
 
             # ================================================================
             # STEP 1: Load PDB structure
             # ================================================================
             pdb = app.PDBFile(str(pdb_path))
-            logger.info(f"  Loaded PDB: {len(list(pdb.topology.atoms()))} atoms")
+            n_atoms = pdb.topology.getNumAtoms()
+            logger.info("  Loaded PDB: %d atoms", n_atoms)
 
             # ================================================================
             # STEP 1.5: Add missing hydrogens (if needed)
             # ================================================================
             modeller = app.Modeller(pdb.topology, pdb.positions)
             modeller.addHydrogens(self.forcefield)
-            logger.info(f"  Added hydrogens: {len(list(modeller.topology.atoms()))} total atoms")
+            n_atoms = modeller.topology.getNumAtoms()
+            logger.info("  Added hydrogens: %d total atoms", n_atoms)
 
             # ================================================================
             # STEP 2: Create OpenMM System
@@ -172,13 +218,13 @@ class EnergyMinimizer:
                 constraints=app.HBonds,
                 removeCMMotion=True,
             )
-            logger.info(f"  Created system with {system.getNumParticles()} particles")
+            logger.info("  Created system with %d particles", system.getNumParticles())
 
             # ================================================================
             # STEP 3: APPLY BACKBONE RESTRAINTS (Module 8 Upgrade)
             # ================================================================
             if stiffness > 0.0:
-                logger.info(f"  Adding harmonic restraints to backbone atoms (CA, C, N)...")
+                logger.info("  Adding harmonic restraints to backbone atoms (CA, C, N)...")
 
                 # Create custom external force for backbone restraints
                 restraint = mm.CustomExternalForce("k * periodicdistance(x, y, z, x0, y0, z0)^2")
@@ -189,18 +235,29 @@ class EnergyMinimizer:
                 restraint.addPerParticleParameter("y0")
                 restraint.addPerParticleParameter("z0")
 
-                # Restrain only backbone atoms (CA, C, N)
-                backbone_atoms = 0
-                for atom in modeller.topology.atoms():
-                    if atom.name in ("CA", "C", "N"):
-                        pos = modeller.positions[atom.index]
-                        restraint.addParticle(atom.index, [pos[0], pos[1], pos[2]])
-                        backbone_atoms += 1
+                # Restrain only backbone atoms (CA, C, N). Positions are converted
+                # to a plain (N, 3) nm array once instead of indexing Quantity per atom.
+                pos_nm = np.asarray(
+                    modeller.positions.value_in_unit(unit.nanometer), dtype=np.float64
+                )
+                names = np.array([atom.name for atom in modeller.topology.atoms()])
+                if HAS_NUMBA and n_atoms > NUMBA_MIN_ATOMS:
+                    # Large complexes: single JIT pass over CA=1, C=2, N=3 codes
+                    code = np.where(
+                        names == "CA", 1, np.where(names == "C", 2, np.where(names == "N", 3, 0))
+                    ).astype(np.int8)
+                    backbone_idx, backbone_pos = _pack_backbone(code, pos_nm)
+                else:
+                    backbone_idx = np.flatnonzero(np.isin(names, ("CA", "C", "N")))
+                    backbone_pos = pos_nm[backbone_idx]
+                for idx, xyz in zip(backbone_idx.tolist(), backbone_pos.tolist()):
+                    restraint.addParticle(idx, xyz)
+                backbone_atoms = len(backbone_idx)
 
                 system.addForce(restraint)
-                logger.info(f"  ✓ Restrained {backbone_atoms} backbone atoms")
+                logger.info("  ✓ Restrained %d backbone atoms", backbone_atoms)
             else:
-                logger.info(f"  No backbone restraints (full flexibility)")
+                logger.info("  No backbone restraints (full flexibility)")
 
             # ================================================================
             # STEP 4: Create Langevin Integrator
@@ -220,15 +277,25 @@ class EnergyMinimizer:
             # ================================================================
             # STEP 6: Calculate Initial Energy
             # ================================================================
-            state0 = simulation.context.getState(getEnergy=True)
+            state0 = simulation.context.getState(getEnergy=True, getForces=True)
             e_init = state0.getPotentialEnergy().value_in_unit(unit.kilojoules_per_mole)
-            logger.info(f"  Initial potential energy: {e_init:.2f} kJ/mol")
+            logger.info("  Initial potential energy: %.2f kJ/mol", e_init)
+
+            forces = state0.getForces(asNumpy=True).value_in_unit(
+                unit.kilojoules_per_mole / unit.nanometer
+            )
+            rms_force = float(np.sqrt((forces * forces).mean()))
+            logger.info("  Initial RMS force: %.3f kJ/mol/nm", rms_force)
 
             # ================================================================
             # STEP 7: MINIMIZATION (The Core Fix)
             # ================================================================
-            logger.info("  Running energy minimization...")
-            simulation.minimizeEnergy(maxIterations=max_iterations)
+            if rms_force < self.grad_tol:
+                # Already at a stationary point (e.g. re-run on a minimized PDB)
+                logger.info("  Structure already at stationary point; skipping L-BFGS")
+            else:
+                logger.info("  Running energy minimization...")
+                simulation.minimizeEnergy(maxIterations=max_iterations)
 
             # ================================================================
             # STEP 8: Calculate Final Energy
@@ -236,16 +303,18 @@ class EnergyMinimizer:
             state1 = simulation.context.getState(getPositions=True, getEnergy=True)
             e_final = state1.getPotentialEnergy().value_in_unit(unit.kilojoules_per_mole)
             energy_change = e_init - e_final
-            logger.info(f"  Final potential energy: {e_final:.2f} kJ/mol")
-            logger.info(f"  Energy change: {energy_change:.2f} kJ/mol")
+            if verbose:
+                logger.info("  Final potential energy: %.2f kJ/mol", e_final)
+                logger.info("  Energy change: %.2f kJ/mol", energy_change)
 
             if energy_change < 10:
                 logger.warning(
-                    f"  Small energy change ({energy_change:.2f} kJ/mol). "
-                    "Structure may already be well-optimized."
+                    "  Small energy change (%.2f kJ/mol). "
+                    "Structure may already be well-optimized.",
+                    energy_change,
                 )
             else:
-                logger.info(f"  ✓ Structure successfully relaxed")
+                logger.info("  ✓ Structure successfully relaxed")
 
             # ================================================================
             # STEP 9: Save Minimized Structure
@@ -253,14 +322,14 @@ class EnergyMinimizer:
             with open(output_path, "w") as f:
                 app.PDBFile.writeFile(modeller.topology, state1.getPositions(), f)
 
-            logger.info(f"  ✓ Relaxed structure saved: {output_path}")
+            logger.info("  ✓ Relaxed structure saved: %s", output_path)
             logger.info("Energy minimization complete!")
 
             return output_path
 
         except Exception as e:
-            logger.error(f"Energy minimization failed: {str(e)}")
-            logger.warning(f"Returning original structure (fail-safe): {pdb_path}")
+            logger.error("Energy minimization failed: %s", e)
+            logger.warning("Returning original structure (fail-safe): %s", pdb_path)
             return pdb_path
 
 
@@ -270,7 +339,10 @@ class EnergyMinimizer:
 
 
 def relax_structure(
-    pdb_path: Path, output_path: Optional[Path] = None, stiffness: float = 0.0
+    pdb_path: Path,
+    output_path: Optional[Path] = None,
+    stiffness: float = 0.0,
+    grad_tol: float = 1.0,
 ) -> Path:
     """
     Convenience function: Relax a protein structure.
@@ -279,11 +351,12 @@ def relax_structure(
         pdb_path: Path to input PDB
         output_path: Path for output (auto-generated if None)
         stiffness: Backbone restraint strength (0.0 = full flexibility)
+        grad_tol: RMS force (kJ/mol/nm) below which minimization is skipped
 
     Returns:
         Path to relaxed PDB
     """
-    minimizer = EnergyMinimizer()
+    minimizer = EnergyMinimizer(grad_tol=grad_tol)
     return minimizer.minimize(pdb_path, output_path, stiffness)
 
 
@@ -4,20 +4,58 @@ Consensus Scoring Framework for Multiple Docking Scoring Functions.
 This module provides infrastructure for combining multiple scoring functions
 to improve binding affinity prediction accuracy. Currently implements Vina scoring
 with extensible architecture for additional scorers (GNINA, RF-Score, etc.).
+
+Scorers are launched the same way as Vina in autoscan.engine.vina: argv lists
+only, absolute executable paths and close_fds=False on POSIX, so CPython can use
+posix_spawn rather than fork+exec for each scoring run.
 """
 
+import asyncio
+import functools
+import os
+import re
+import shutil
 import subprocess
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 from autoscan.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Scoring results use slots on Python 3.10+ (no per-instance __dict__)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_SPAWN_KWARGS = {"close_fds": False} if os.name == "posix" else {}
+
+# Output parsers, compiled once at import time
+_VINA_SCORE_RE = re.compile(r"([-+]?\d+\.\d+)\s+kcal/mol")
+_GNINA_CNN_RE = re.compile(r"CNNaffinity\s+:\s+([-+]?\d+\.\d+)")
+_RF_SCORE_RE = re.compile(r"([-+]?\d+\.\d+)")
+
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _probe(executable: str) -> bool:
+    """Check once per process whether a scoring executable can be launched."""
+    try:
+        subprocess.run(
+            [executable, "--help"],
+            capture_output=True,
+            timeout=5,
+            check=False,
+            **_SPAWN_KWARGS,
+        )
+        return True
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ScoringResult:
     """Individual scoring function result."""
 
@@ -27,7 +65,7 @@ class ScoringResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ConsensusScoringResult:
     """Consensus result from multiple scorers."""
 
@@ -41,6 +79,11 @@ class ConsensusScoringResult:
 class Scorer(ABC):
     """Abstract base class for scoring functions."""
 
+    #: Human-readable name used in error messages
+    label: str = "Scorer"
+    #: Seconds before a scoring run is abandoned
+    timeout: int = 120
+
     def __init__(self, executable: str):
         """
         Initialize scorer.
@@ -48,17 +91,52 @@ class Scorer(ABC):
         Args:
             executable: Path or name of the scoring executable.
         """
-        self.executable = executable
-        self.available = self._check_availability()
+        self.executable = shutil.which(executable) or executable
+        self.available = _probe(self.executable)
 
     @abstractmethod
-    def score(self, receptor_pdbqt: Path, ligand_pdbqt: Path) -> float:
+    def build_command(
+        self,
+        receptor_pdbqt: Path,
+        ligand_pdbqt: Path,
+        grid_args: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Build the argv used to score a docked complex.
+
+        Args:
+            receptor_pdbqt: Path to receptor PDBQT file.
+            ligand_pdbqt: Path to ligand PDBQT file.
+            grid_args: Grid box parameters (scorer-specific).
+
+        Returns:
+            Command line as a list of strings.
+        """
+        pass
+
+    @abstractmethod
+    def parse_output(self, output: str) -> float:
+        """
+        Extract the binding affinity from combined stdout/stderr.
+
+        Raises:
+            RuntimeError: If the output cannot be parsed.
+        """
+        pass
+
+    def score(
+        self,
+        receptor_pdbqt: Path,
+        ligand_pdbqt: Path,
+        grid_args: Optional[List[str]] = None,
+    ) -> float:
         """
         Score a docked complex.
 
         Args:
             receptor_pdbqt: Path to receptor PDBQT file.
             ligand_pdbqt: Path to ligand PDBQT file.
+            grid_args: Grid box parameters (scorer-specific).
 
         Returns:
             Binding affinity in kcal/mol.
@@ -66,51 +144,45 @@ class Scorer(ABC):
         Raises:
             RuntimeError: If scoring fails.
         """
-        pass
+        cmd = self.build_command(receptor_pdbqt, ligand_pdbqt, grid_args)
 
-    def _check_availability(self) -> bool:
-        """Check if scorer executable is available."""
         try:
-            subprocess.run(
-                [self.executable, "--help"],
+            result = subprocess.run(
+                cmd,
+                check=True,
                 capture_output=True,
-                timeout=5,
-                check=False,
+                text=True,
+                timeout=self.timeout,
+                **_SPAWN_KWARGS,
             )
-            return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"{self.label} scoring failed: {e.stderr}")
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"{self.label} scoring timed out")
+
+        return self.parse_output(result.stdout + result.stderr)
 
 
 class VinaScorer(Scorer):
     """Vina scoring function."""
 
+    label = "Vina"
+    timeout = 60
+
     def __init__(self, executable: str = "vina"):
         super().__init__(executable)
 
-    def score(
+    def build_command(
         self,
         receptor_pdbqt: Path,
         ligand_pdbqt: Path,
         grid_args: Optional[List[str]] = None,
-    ) -> float:
-        """
-        Score using Vina.
-
-        Args:
-            receptor_pdbqt: Path to receptor PDBQT.
-            ligand_pdbqt: Path to ligand PDBQT.
-            grid_args: Grid box parameters (required for Vina).
-
-        Returns:
-            Binding affinity in kcal/mol.
-        """
+    ) -> List[str]:
+        """Build a Vina ``--score_only`` command (grid_args are required)."""
         if grid_args is None:
             raise ValueError("Vina scoring requires grid_args")
 
-        import re
-
-        cmd = [
+        return [
             self.executable,
             "--receptor",
             str(receptor_pdbqt),
@@ -131,23 +203,14 @@ class VinaScorer(Scorer):
             "--score_only",
         ]
 
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=60)
-            output = result.stdout + result.stderr
-
-            # Parse binding affinity from stdout
-            match = re.search(r"([-+]?\d+\.\d+)\s+kcal/mol", output)
-            if match:
-                affinity = float(match.group(1))
-                logger.debug(f"Vina score: {affinity} kcal/mol")
-                return affinity
-            else:
-                raise RuntimeError("Could not parse Vina output")
-
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Vina scoring failed: {e.stderr}")
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("Vina scoring timed out")
+    def parse_output(self, output: str) -> float:
+        """Parse the Vina affinity from ``--score_only`` output."""
+        match = _VINA_SCORE_RE.search(output)
+        if not match:
+            raise RuntimeError("Could not parse Vina output")
+        affinity = float(match.group(1))
+        logger.debug(f"Vina score: {affinity} kcal/mol")
+        return affinity
 
 
 class GNINAScorer(Scorer):
@@ -158,6 +221,8 @@ class GNINAScorer(Scorer):
     https://github.com/gnina/gnina
     """
 
+    label = "GNINA"
+
     def __init__(self, executable: str = "gnina"):
         super().__init__(executable)
         if self.available:
@@ -165,29 +230,17 @@ class GNINAScorer(Scorer):
         else:
             logger.warning("GNINA not found. Install from: https://github.com/gnina/gnina")
 
-    def score(
+    def build_command(
         self,
         receptor_pdbqt: Path,
         ligand_pdbqt: Path,
         grid_args: Optional[List[str]] = None,
-    ) -> float:
-        """
-        Score using GNINA (CNN scoring function).
-
-        Args:
-            receptor_pdbqt: Path to receptor PDBQT.
-            ligand_pdbqt: Path to ligand PDBQT.
-            grid_args: Grid box parameters (optional for GNINA).
-
-        Returns:
-            Binding affinity in kcal/mol.
-        """
+    ) -> List[str]:
+        """Build a GNINA CNN ``--score_only`` command (grid_args unused)."""
         if not self.available:
             raise RuntimeError("GNINA not available")
 
-        import re
-
-        cmd = [
+        return [
             self.executable,
             "-r",
             str(receptor_pdbqt),
@@ -196,23 +249,14 @@ class GNINAScorer(Scorer):
             "--score_only",
         ]
 
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=120)
-            output = result.stdout + result.stderr
-
-            # Parse CNN affinity score
-            match = re.search(r"CNNaffinity\s+:\s+([-+]?\d+\.\d+)", output)
-            if match:
-                affinity = float(match.group(1))
-                logger.debug(f"GNINA CNN score: {affinity} kcal/mol")
-                return affinity
-            else:
-                raise RuntimeError("Could not parse GNINA output")
-
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"GNINA scoring failed: {e.stderr}")
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("GNINA scoring timed out")
+    def parse_output(self, output: str) -> float:
+        """Parse the CNN affinity from GNINA output."""
+        match = _GNINA_CNN_RE.search(output)
+        if not match:
+            raise RuntimeError("Could not parse GNINA output")
+        affinity = float(match.group(1))
+        logger.debug(f"GNINA CNN score: {affinity} kcal/mol")
+        return affinity
 
 
 class RFScoreScorer(Scorer):
@@ -222,6 +266,8 @@ class RFScoreScorer(Scorer):
     Note: RF-Score must be installed separately.
     """
 
+    label = "RF-Score"
+
     def __init__(self, executable: str = "rf_score"):
         super().__init__(executable)
         if self.available:
@@ -229,47 +275,26 @@ class RFScoreScorer(Scorer):
         else:
             logger.warning("RF-Score not found. Consider installing for better accuracy.")
 
-    def score(
+    def build_command(
         self,
         receptor_pdbqt: Path,
         ligand_pdbqt: Path,
         grid_args: Optional[List[str]] = None,
-    ) -> float:
-        """
-        Score using RF-Score.
-
-        Args:
-            receptor_pdbqt: Path to receptor PDBQT.
-            ligand_pdbqt: Path to ligand PDBQT.
-            grid_args: Unused for RF-Score.
-
-        Returns:
-            Binding affinity in kcal/mol.
-        """
+    ) -> List[str]:
+        """Build an RF-Score command (grid_args unused)."""
         if not self.available:
             raise RuntimeError("RF-Score not available")
 
-        import re
-
-        cmd = [self.executable, str(receptor_pdbqt), str(ligand_pdbqt)]
-
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=120)
-            output = result.stdout + result.stderr
-
-            # Parse RF-Score prediction (format varies)
-            match = re.search(r"([-+]?\d+\.\d+)", output)
-            if match:
-                affinity = float(match.group(1))
-                logger.debug(f"RF-Score: {affinity} kcal/mol")
-                return affinity
-            else:
-                raise RuntimeError("Could not parse RF-Score output")
+        return [self.executable, str(receptor_pdbqt), str(ligand_pdbqt)]
 
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"RF-Score failed: {e.stderr}")
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("RF-Score timed out")
+    def parse_output(self, output: str) -> float:
+        """Parse the RF-Score prediction (format varies)."""
+        match = _RF_SCORE_RE.search(output)
+        if not match:
+            raise RuntimeError("Could not parse RF-Score output")
+        affinity = float(match.group(1))
+        logger.debug(f"RF-Score: {affinity} kcal/mol")
+        return affinity
 
 
 class ConsensusScorer:
@@ -294,6 +319,14 @@ class ConsensusScorer:
         if rf_score.available:
             self.scorers["rf_score"] = rf_score
 
+        # Availability is fixed for the process (probes are cached), so resolve it once
+        self._available: List[Tuple[str, Scorer]] = []
+        for scorer_name, scorer in self.scorers.items():
+            if scorer.available:
+                self._available.append((scorer_name, scorer))
+            else:
+                logger.warning(f"Scorer {scorer_name} not available, skipping")
+
         logger.info(f"Consensus scorer initialized with: {', '.join(self.scorers.keys())}")
 
     def score(
@@ -302,7 +335,7 @@ class ConsensusScorer:
         ligand_pdbqt: Path,
         grid_args: List[str],
         method: str = "mean",
-        use_all: bool = False,
+        precomputed: Optional[Dict[str, float]] = None,
     ) -> ConsensusScoringResult:
         """
         Run consensus scoring.
@@ -312,7 +345,8 @@ class ConsensusScorer:
             ligand_pdbqt: Path to ligand PDBQT.
             grid_args: Grid box parameters for Vina.
             method: Consensus method ("mean", "median", "weighted").
-            use_all: If True, try all scorers. If False, use only available ones.
+            precomputed: Scores already known for this pose, keyed by scorer name
+                (e.g. the Vina affinity from docking). Those scorers are not re-run.
 
         Returns:
             ConsensusScoringResult with individual and consensus scores.
@@ -320,35 +354,47 @@ class ConsensusScorer:
         individual_scores: Dict[str, float] = {}
         failed_scorers = []
 
-        logger.info(f"Running consensus scoring (method={method})")
+        precomputed = precomputed or {}
 
-        for scorer_name, scorer in self.scorers.items():
-            try:
-                if not scorer.available:
-                    logger.warning(f"Scorer {scorer_name} not available, skipping")
-                    continue
+        logger.info(f"Running consensus scoring (method={method})")
 
-                if scorer_name == "vina":
-                    score = scorer.score(receptor_pdbqt, ligand_pdbqt, grid_args)
-                else:
-                    score = scorer.score(receptor_pdbqt, ligand_pdbqt)
+        # Scorers are independent subprocesses, so run them concurrently on one
+        # event loop. Results are read back in registration order so "weighted"
+        # keeps Vina first.
+        to_run = [(name, scorer) for name, scorer in self._available if name not in precomputed]
+        results = (
+            self._run_gather(to_run, receptor_pdbqt, ligand_pdbqt, grid_args) if to_run else []
+        )
+        outcomes = dict(zip((name for name, _ in to_run), results))
 
+        for scorer_name in self.scorers:
+            if scorer_name in precomputed:
+                score = precomputed[scorer_name]
                 individual_scores[scorer_name] = score
-                logger.info(f"{scorer_name}: {score:.2f} kcal/mol")
+                logger.info(f"{scorer_name}: {score:.2f} kcal/mol (precomputed)")
+                continue
+            if scorer_name not in outcomes:
+                continue
 
-            except Exception as e:
-                logger.warning(f"Scorer {scorer_name} failed: {e}")
+            score = outcomes[scorer_name]
+            if isinstance(score, BaseException):
+                logger.warning(f"Scorer {scorer_name} failed: {score}")
                 failed_scorers.append(scorer_name)
                 continue
 
+            individual_scores[scorer_name] = score
+            logger.info(f"{scorer_name}: {score:.2f} kcal/mol")
+
         if not individual_scores:
             raise RuntimeError("No scorers produced valid results")
 
+        scores = list(individual_scores.values())
+
         # Calculate consensus
-        consensus_affinity = self._calculate_consensus(list(individual_scores.values()), method)
+        consensus_affinity = self._calculate_consensus(scores, method)
 
         # Calculate uncertainty (standard deviation)
-        uncertainty = self._calculate_uncertainty(list(individual_scores.values()))
+        uncertainty = self._calculate_uncertainty(scores)
 
         all_available = len(failed_scorers) == 0
 
@@ -364,30 +410,98 @@ class ConsensusScorer:
 
         return result
 
+    def _run_gather(
+        self, to_run: list, receptor_pdbqt: Path, ligand_pdbqt: Path, grid_args: List[str]
+    ) -> list:
+        """
+        Run _gather_scores to completion from synchronous code.
+
+        asyncio.run refuses to start inside a running event loop (Jupyter, async
+        callers), so in that case the gather gets its own loop on a worker thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._gather_scores(to_run, receptor_pdbqt, ligand_pdbqt, grid_args))
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(
+                asyncio.run, self._gather_scores(to_run, receptor_pdbqt, ligand_pdbqt, grid_args)
+            ).result()
+
+    async def _gather_scores(
+        self,
+        scorers: List[Tuple[str, Scorer]],
+        receptor_pdbqt: Path,
+        ligand_pdbqt: Path,
+        grid_args: List[str],
+    ) -> List[Union[float, BaseException]]:
+        """Run all scorers concurrently; failures are returned, not raised."""
+        return await asyncio.gather(
+            *(
+                self._score_async(scorer, receptor_pdbqt, ligand_pdbqt, grid_args)
+                for _, scorer in scorers
+            ),
+            return_exceptions=True,
+        )
+
+    @staticmethod
+    async def _score_async(
+        scorer: Scorer,
+        receptor_pdbqt: Path,
+        ligand_pdbqt: Path,
+        grid_args: List[str],
+    ) -> float:
+        """
+        Asynchronous counterpart of ``Scorer.score``.
+
+        Uses the scorer's own command line and parser, so results are identical
+        to the blocking path.
+        """
+        cmd = scorer.build_command(receptor_pdbqt, ligand_pdbqt, grid_args)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **_SPAWN_KWARGS,
+        )
+        try:
+            out, err = await asyncio.wait_for(proc.communicate(), timeout=scorer.timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise RuntimeError(f"{scorer.label} scoring timed out")
+
+        stdout = out.decode(errors="replace")
+        stderr = err.decode(errors="replace")
+        if proc.returncode != 0:
+            raise RuntimeError(f"{scorer.label} scoring failed: {stderr}")
+        return scorer.parse_output(stdout + stderr)
+
     @staticmethod
     def _calculate_consensus(scores: List[float], method: str = "mean") -> float:
         """Calculate consensus from multiple scores."""
+        arr = np.asarray(scores, dtype=np.float64)
         if method == "mean":
-            return sum(scores) / len(scores)
+            return float(arr.mean())
         elif method == "median":
-            import statistics
-
-            return statistics.median(scores)
+            return float(np.median(arr))
         elif method == "weighted":
             # Weight Vina higher (primary scorer)
-            if len(scores) == 1:
-                return scores[0]
+            if len(arr) == 1:
+                return float(arr[0])
             # Weighted average: Vina=0.5, others=0.5/n
-            weights = [0.5] + [0.5 / (len(scores) - 1)] * (len(scores) - 1)
-            return sum(s * w for s, w in zip(scores, weights))
+            weights = np.full(len(arr), 0.5 / (len(arr) - 1))
+            weights[0] = 0.5
+            return float(arr @ weights)
         else:
             raise ValueError(f"Unknown consensus method: {method}")
 
     @staticmethod
     def _calculate_uncertainty(scores: List[float]) -> float:
-        """Calculate uncertainty (std dev) from multiple scores."""
+        """Calculate uncertainty (sample std dev) from multiple scores."""
         if len(scores) < 2:
             return 0.0
-        import statistics
-
-        return statistics.stdev(scores)
+        return float(np.std(np.asarray(scores, dtype=np.float64), ddof=1))
@@ -1,20 +1,68 @@
 """
 Vina Wrapper: Execute molecular docking simulations.
+
+Process launching: every child is started from an argv list (never shell=True,
+no preexec_fn/pass_fds), the executable is resolved to an absolute path once,
+and close_fds=False is passed on POSIX. Together these let CPython start Vina
+with posix_spawn (vfork semantics) instead of fork+exec, which avoids copying
+the parent's page tables on every launch in large screens. Python-created file
+descriptors are non-inheritable by default (PEP 446), so nothing leaks.
 """
 
 import json
+import os
 import re
+import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from autoscan.utils import get_logger
 
-logger = get_logger(__name__)
+try:
+    import orjson
 
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = get_logger(__name__)
 
-@dataclass
+# Result objects are created per ligand in batch screens; slots (Python 3.10+)
+# drop the per-instance __dict__.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# See module docstring: keeps subprocess on the posix_spawn fast path
+_SPAWN_KWARGS = {"close_fds": False} if os.name == "posix" else {}
+
+# Output parsers, compiled once at import time
+# Results-table row: mode, affinity (kcal/mol), RMSD l.b., RMSD u.b.
+_TABLE_ROW_RE = re.compile(
+    r"^\s*(\d+)\s+([-+]?\d*\.?\d+)\s+([-+]?\d*\.?\d+)\s+([-+]?\d*\.?\d+)\s*$", re.MULTILINE
+)
+_AFFINITY_KCAL_RE = re.compile(r"([-+]?\d*\.?\d+(?:e[-+]?\d+)?)\s+kcal/mol")
+# Pose header in docked PDBQT output: affinity, RMSD l.b., RMSD u.b.
+_VINA_RESULT_RE = re.compile(
+    r"^REMARK VINA RESULT:\s+([-+]?\d*\.?\d+)\s+([-+]?\d*\.?\d+)\s+([-+]?\d*\.?\d+)",
+    re.MULTILINE,
+)
+
+# Vina-compatible docking binaries. All accept the same --receptor/--ligand/
+# --center_*/--size_*/--out/--cpu/--num_modes flags and print the same table,
+# except Uni-Dock (GPU), which docks ligand batches into a --dir (see _dock_unidock).
+ENGINE_EXECUTABLES = {"vina": "vina", "qvina2": "qvina2", "smina": "smina", "unidock": "unidock"}
+# Order tried by engine="auto": QuickVina 2 is markedly faster than Vina. Uni-Dock
+# needs a CUDA GPU, so it is only used when asked for.
+_ENGINE_PREFERENCE = ("qvina2", "vina", "smina")
+_ENGINE_BANNERS = ("AutoScan Vina", "AutoDock Vina", "QuickVina", "smina", "Uni-Dock")
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class DockingResult:
     """Result of a docking simulation."""
 
@@ -26,19 +74,38 @@ class DockingResult:
     consensus_scores: Dict[str, float] = field(default_factory=dict)  # Individual scorer results
     consensus_affinity: Optional[float] = None  # Consensus from multiple scorers
     consensus_uncertainty: float = 0.0  # Std dev of consensus scores
+    # All (mode, affinity, rmsd_lb, rmsd_ub) rows of the Vina results table
+    modes: List[Tuple[int, float, float, float]] = field(default_factory=list)
 
 
 class VinaWrapper:
     """Wrapper around the Vina binary for molecular docking."""
 
-    def __init__(self, vina_executable: str = "vina"):
+    def __init__(self, vina_executable: Optional[str] = None, engine: str = "vina"):
         """
         Initialize Vina wrapper.
 
         Args:
-            vina_executable: Path to the Vina executable. Defaults to 'vina' (assumes in PATH).
+            vina_executable: Path to the docking executable. Defaults to the
+                engine's binary name (assumes in PATH).
+            engine: Docking backend: "vina", "qvina2", "smina", "unidock" (GPU),
+                or "auto" to pick the fastest CPU engine found on PATH.
         """
-        self.vina_executable = vina_executable
+        if engine == "auto":
+            engine = next(
+                (e for e in _ENGINE_PREFERENCE if shutil.which(ENGINE_EXECUTABLES[e])), "vina"
+            )
+        if engine not in ENGINE_EXECUTABLES:
+            raise ValueError(
+                f"Unknown docking engine: {engine}. "
+                f"Choose from: {', '.join(ENGINE_EXECUTABLES)}, auto"
+            )
+        self.engine = engine
+        executable = vina_executable or ENGINE_EXECUTABLES[engine]
+        # posix_spawn is only used for executables given with a directory part
+        self.vina_executable = shutil.which(executable) or executable
+        self._base_cmd = (self.vina_executable,)  # fixed argv prefix spliced into each dock
+        self._consensus_scorer = None  # Created on first consensus run, then reused
         self._verify_installation()
 
     def _verify_installation(self):
@@ -50,9 +117,11 @@ class VinaWrapper:
                 capture_output=True,
                 text=True,
                 timeout=5,
+                **_SPAWN_KWARGS,
             )
-            if "AutoScan Vina" in result.stdout or "AutoScan Vina" in result.stderr:
-                logger.info(f"Vina found: {self.vina_executable}")
+            help_text = result.stdout + result.stderr
+            if any(banner in help_text for banner in _ENGINE_BANNERS):
+                logger.info(f"Vina found: {self.vina_executable} (engine={self.engine})")
             else:
                 logger.warning("Vina help output unexpected")
         except subprocess.CalledProcessError as e:
@@ -75,6 +144,8 @@ class VinaWrapper:
         use_consensus: bool = False,
         consensus_method: str = "mean",
         flex_pdbqt: Optional[Path] = None,
+        write_maps: Optional[Path] = None,
+        maps: Optional[Path] = None,
     ) -> DockingResult:
         """
         Execute docking simulation with optional consensus scoring.
@@ -89,6 +160,10 @@ class VinaWrapper:
             exhaustiveness: Search exhaustiveness (default 8, use 32 for deep search).
             use_consensus: If True, use consensus scoring from multiple scorers.
             consensus_method: Method for consensus ("mean", "median", "weighted").
+            write_maps: Prefix to save the receptor affinity maps under (Vina only).
+            maps: Prefix of maps saved by an earlier write_maps run for the same
+                receptor and box; docking loads them instead of the receptor,
+                skipping grid computation (Vina only).
 
         Returns:
             DockingResult with binding affinity and optional consensus scores.
@@ -104,12 +179,40 @@ class VinaWrapper:
         else:
             output_pdbqt = Path(output_pdbqt)
 
+        # Stringify paths once; they are reused for the result and consensus scoring
+        receptor_str = str(receptor_pdbqt)
+        ligand_str = str(ligand_pdbqt)
+
+        if (write_maps or maps) and self.engine != "vina":
+            logger.info(f"{self.engine} has no affinity-map files; computing the grid")
+            write_maps = maps = None
+        if self.engine == "unidock":
+            docking_result = self._dock_unidock(
+                receptor_pdbqt,
+                [(ligand_pdbqt, output_pdbqt)],
+                grid_args,
+                num_modes=num_modes,
+                exhaustiveness=exhaustiveness,
+                flex_pdbqt=flex_pdbqt,
+            )[0]
+            if use_consensus:
+                docking_result = self._apply_consensus_scoring(
+                    docking_result, receptor_str, ligand_str, grid_args, consensus_method
+                )
+            return docking_result
+        if maps:
+            # The maps carry the receptor and the search box
+            target_args = ["--maps", str(maps)]
+        else:
+            target_args = ["--receptor", receptor_str, *grid_args]
+            if write_maps:
+                target_args += ["--write_maps", str(write_maps)]
+
         cmd = [
-            self.vina_executable,
-            "--receptor",
-            str(receptor_pdbqt),
+            *self._base_cmd,
+            *target_args,
             "--ligand",
-            str(ligand_pdbqt),
+            ligand_str,
             "--out",
             str(output_pdbqt),
             "--cpu",
@@ -118,7 +221,7 @@ class VinaWrapper:
             str(num_modes),
             "--exhaustiveness",
             str(exhaustiveness),
-        ] + grid_args
+        ]
 
         # Add flexible side-chain docking if specified
         if flex_pdbqt:
@@ -126,42 +229,404 @@ class VinaWrapper:
 
         logger.info(f"Running Vina: {' '.join(cmd)}")
 
+        modes, output_tail = self._stream_vina(cmd, timeout=300)
+        if modes:
+            _, affinity, rmsd_lb, rmsd_ub = modes[0]
+        else:
+            # Legacy output without a results table
+            match = _AFFINITY_KCAL_RE.search(output_tail)
+            if not match:
+                raise RuntimeError("Could not parse binding affinity from Vina output")
+            affinity, rmsd_lb, rmsd_ub = float(match.group(1)), 0.0, 0.0
+
+        logger.info(f"Docking completed. Binding Affinity: {affinity} kcal/mol")
+
+        docking_result = DockingResult(
+            binding_affinity=affinity,
+            rmsd_lb=rmsd_lb,
+            rmsd_ub=rmsd_ub,
+            ligand_pdbqt=ligand_str,
+            receptor_pdbqt=receptor_str,
+            modes=modes,
+        )
+
+        # Apply consensus scoring if requested
+        if use_consensus:
+            docking_result = self._apply_consensus_scoring(
+                docking_result, receptor_str, ligand_str, grid_args, consensus_method
+            )
+
+        return docking_result
+
+    def _stream_vina(
+        self, cmd: List[str], timeout: int = 300
+    ) -> Tuple[List[Tuple[int, float, float, float]], str]:
+        """
+        Run Vina and parse its output line by line as it is produced.
+
+        Stdout and stderr are merged into one pipe; only the last 200 lines are
+        retained (for error reporting and the results table), so memory does not
+        grow with verbose output.
+
+        Args:
+            cmd: Full Vina command line.
+            timeout: Seconds before the process is killed.
+
+        Returns:
+            Tuple of (results-table rows, retained output tail).
+
+        Raises:
+            RuntimeError: If Vina fails or times out.
+        """
+        tail: deque = deque(maxlen=200)
+        modes: List[Tuple[int, float, float, float]] = []
+        timed_out = threading.Event()
+
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            **_SPAWN_KWARGS,
+        )
+
+        def _kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
         try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=300)
-            output_text = result.stdout + result.stderr
+            for line in proc.stdout:
+                tail.append(line)
+                modes.extend(self._parse_table(line))
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+
+        output_tail = "".join(tail)
+        if timed_out.is_set():
+            raise RuntimeError(f"Vina docking timed out (exceeded {timeout // 60} minutes)")
+        if returncode != 0:
+            raise RuntimeError(f"Vina docking failed: {output_tail}")
+        return modes, output_tail
+
+    def dock_batch(
+        self,
+        receptor_pdbqt: Path,
+        ligand_pdbqts: List[Path],
+        grid_args: list,
+        output_dir: Optional[Path] = None,
+        cpu: int = 4,
+        num_modes: int = 9,
+        exhaustiveness: int = 8,
+    ) -> Iterator[DockingResult]:
+        """
+        Dock many ligands against one receptor, computing receptor maps once.
+
+        With engine="unidock" the whole batch is one Uni-Dock GPU run (one run
+        per ligand if two ligands share a file name). Otherwise uses the Vina
+        Python bindings when installed (engine="vina" only) so the receptor is
+        loaded and its grid maps are computed a single time for the whole
+        batch. Without the bindings, engine="vina" docks the batch in a single
+        `vina --batch` process. Falls back to one dock() subprocess per ligand
+        otherwise (or if that run fails); with the vina engine a receptor-only
+        run first writes maps for all atom types and every ligand loads them.
 
-            # Parse binding affinity from Vina output
-            affinity = self._parse_affinity(output_text)
-            rmsd_lb, rmsd_ub = self._parse_rmsd(output_text)
+        Args:
+            receptor_pdbqt: Path to receptor in PDBQT format.
+            ligand_pdbqts: Ligand PDBQT files to dock.
+            grid_args: Grid box parameters from GridCalculator.to_vina_args().
+            output_dir: Directory for docked poses. Defaults to next to each ligand.
+            cpu: Number of CPUs to use.
+            num_modes: Number of binding modes to generate.
+            exhaustiveness: Search exhaustiveness.
 
-            logger.info(f"Docking completed. Binding Affinity: {affinity} kcal/mol")
+        Yields:
+            DockingResult for each ligand, in input order.
 
-            docking_result = DockingResult(
+        Raises:
+            RuntimeError: If docking fails.
+        """
+        receptor_pdbqt = Path(receptor_pdbqt)
+        ligand_pdbqts = [Path(ligand) for ligand in ligand_pdbqts]
+
+        def output_for(ligand: Path) -> Path:
+            docked = ligand.with_stem(ligand.stem + "_docked")
+            return Path(output_dir) / docked.name if output_dir else docked
+
+        # Batch runs (Uni-Dock, vina --batch) name outputs by ligand stem, so
+        # stems must be unique for their poses to be told apart
+        unique_stems = len({ligand.stem for ligand in ligand_pdbqts}) == len(ligand_pdbqts)
+
+        if self.engine == "unidock":
+            if unique_stems:
+                yield from self._dock_unidock(
+                    receptor_pdbqt,
+                    [(ligand, output_for(ligand)) for ligand in ligand_pdbqts],
+                    grid_args,
+                    num_modes=num_modes,
+                    exhaustiveness=exhaustiveness,
+                )
+                return
+            logger.warning("Duplicate ligand file names; running Uni-Dock one ligand at a time")
+
+        Vina = None
+        if self.engine == "vina":  # the bindings implement Vina itself, not its forks
+            try:
+                from vina import Vina
+            except ImportError:
+                logger.info("Vina Python bindings not installed")
+        if Vina is None and self.engine == "vina" and unique_stems and len(ligand_pdbqts) > 1:
+            try:
+                results = self._dock_vina_batch(
+                    receptor_pdbqt,
+                    [(ligand, output_for(ligand)) for ligand in ligand_pdbqts],
+                    grid_args,
+                    cpu=cpu,
+                    num_modes=num_modes,
+                    exhaustiveness=exhaustiveness,
+                )
+            except RuntimeError as e:
+                logger.warning(f"Vina batch run failed, docking ligands one by one: {e}")
+            else:
+                yield from results
+                return
+        if Vina is None:
+            logger.info("Docking ligands one process at a time")
+            with tempfile.TemporaryDirectory(prefix="autoscan_maps_") as maps_dir:
+                maps_prefix = Path(maps_dir) / "receptor"
+                have_maps = (
+                    self.engine == "vina"
+                    and len(ligand_pdbqts) > 1
+                    and self._write_receptor_maps(receptor_pdbqt, grid_args, maps_prefix, cpu)
+                )
+                for ligand in ligand_pdbqts:
+                    yield self.dock(
+                        receptor_pdbqt,
+                        ligand,
+                        grid_args,
+                        output_pdbqt=output_for(ligand),
+                        cpu=cpu,
+                        num_modes=num_modes,
+                        exhaustiveness=exhaustiveness,
+                        maps=maps_prefix if have_maps else None,
+                    )
+            return
+
+        center, box_size = self._grid_from_args(grid_args)
+        try:
+            v = Vina(sf_name="vina", cpu=cpu, verbosity=0)
+            v.set_receptor(str(receptor_pdbqt))
+            v.compute_vina_maps(center=center, box_size=box_size)
+        except Exception as e:
+            raise RuntimeError(f"Vina receptor setup failed: {e}")
+        logger.info(f"Receptor maps computed once for {len(ligand_pdbqts)} ligands")
+
+        for ligand in ligand_pdbqts:
+            output_pdbqt = output_for(ligand)
+            try:
+                v.set_ligand_from_file(str(ligand))
+                v.dock(exhaustiveness=exhaustiveness, n_poses=num_modes)
+                v.write_poses(str(output_pdbqt), n_poses=num_modes, overwrite=True)
+                energies = v.energies(n_poses=1)
+            except Exception as e:
+                raise RuntimeError(f"Vina docking failed for {ligand}: {e}")
+
+            affinity = float(energies[0][0])
+            logger.info(f"Docked {ligand.name}. Binding Affinity: {affinity} kcal/mol")
+
+            # The best mode is the RMSD reference, so its lb/ub are zero by definition
+            yield DockingResult(
                 binding_affinity=affinity,
-                rmsd_lb=rmsd_lb,
-                rmsd_ub=rmsd_ub,
-                ligand_pdbqt=str(ligand_pdbqt),
+                rmsd_lb=0.0,
+                rmsd_ub=0.0,
+                ligand_pdbqt=str(ligand),
                 receptor_pdbqt=str(receptor_pdbqt),
             )
 
-            # Apply consensus scoring if requested
-            if use_consensus:
-                docking_result = self._apply_consensus_scoring(
-                    docking_result, receptor_pdbqt, ligand_pdbqt, grid_args, consensus_method
-                )
+    def _write_receptor_maps(
+        self, receptor_pdbqt: Path, grid_args: list, maps_prefix: Path, cpu: int = 4
+    ) -> bool:
+        """
+        Write the receptor's affinity maps for every ligand atom type.
 
-            return docking_result
+        Run without --ligand, so the maps are not limited to one ligand's atom
+        types and any ligand docked into the same box can load them.
 
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Vina docking failed: {e.stderr}")
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("Vina docking timed out (exceeded 5 minutes)")
+        Returns:
+            True if maps were written; False (logged) if Vina could not write them.
+        """
+        cmd = [
+            *self._base_cmd,
+            "--receptor",
+            str(receptor_pdbqt),
+            *grid_args,
+            "--write_maps",
+            str(maps_prefix),
+            "--cpu",
+            str(cpu),
+        ]
+        logger.info(f"Writing receptor maps: {' '.join(cmd)}")
+        try:
+            self._stream_vina(cmd, timeout=300)
+        except RuntimeError as e:
+            logger.warning(f"Could not write receptor maps, computing them per ligand: {e}")
+            return False
+        return any(maps_prefix.parent.glob("*.map"))
+
+    def _dock_unidock(
+        self,
+        receptor_pdbqt: Path,
+        jobs: List[Tuple[Path, Path]],
+        grid_args: list,
+        num_modes: int = 9,
+        exhaustiveness: int = 8,
+        flex_pdbqt: Optional[Path] = None,
+    ) -> List[DockingResult]:
+        """
+        Dock (ligand, output) pairs in a single Uni-Dock GPU run.
+
+        Uni-Dock takes the ligands through --ligand_index and writes one
+        <ligand stem>_out.pdbqt per ligand into --dir (see _collect_dir_poses).
+
+        Raises:
+            RuntimeError: If Uni-Dock fails or a ligand has no docked pose.
+        """
+        receptor_str = str(receptor_pdbqt)
+        with tempfile.TemporaryDirectory(prefix="autoscan_unidock_") as run_dir:
+            run_dir = Path(run_dir)
+            index_file = run_dir / "ligands.txt"
+            index_file.write_text("".join(f"{ligand}\n" for ligand, _ in jobs))
+            out_dir = run_dir / "out"
+            out_dir.mkdir()
+
+            cmd = [
+                *self._base_cmd,
+                "--receptor",
+                receptor_str,
+                *grid_args,
+                "--ligand_index",
+                str(index_file),
+                "--dir",
+                str(out_dir),
+                "--scoring",
+                "vina",
+                "--num_modes",
+                str(num_modes),
+                "--exhaustiveness",
+                str(exhaustiveness),
+            ]
+            if flex_pdbqt:
+                cmd.extend(["--flex", str(flex_pdbqt)])
+
+            logger.info(f"Running Uni-Dock on {len(jobs)} ligand(s): {' '.join(cmd)}")
+            self._stream_vina(cmd, timeout=300)
+            return self._collect_dir_poses(out_dir, jobs, receptor_str)
+
+    def _dock_vina_batch(
+        self,
+        receptor_pdbqt: Path,
+        jobs: List[Tuple[Path, Path]],
+        grid_args: list,
+        cpu: int = 4,
+        num_modes: int = 9,
+        exhaustiveness: int = 8,
+    ) -> List[DockingResult]:
+        """
+        Dock (ligand, output) pairs in one Vina process using its --batch mode.
+
+        Vina (1.2+) loads the receptor and computes its grid maps once, docks
+        each ligand in turn and writes <ligand stem>_out.pdbqt into --dir.
+
+        Raises:
+            RuntimeError: If Vina fails (e.g. a 1.1 binary without --batch) or
+                a ligand has no docked pose.
+        """
+        receptor_str = str(receptor_pdbqt)
+        with tempfile.TemporaryDirectory(prefix="autoscan_batch_") as out_dir:
+            out_dir = Path(out_dir)
+            cmd = [
+                *self._base_cmd,
+                "--receptor",
+                receptor_str,
+                *grid_args,
+                "--batch",
+                *(str(ligand) for ligand, _ in jobs),
+                "--dir",
+                str(out_dir),
+                "--cpu",
+                str(cpu),
+                "--num_modes",
+                str(num_modes),
+                "--exhaustiveness",
+                str(exhaustiveness),
+            ]
+
+            logger.info(f"Running Vina batch on {len(jobs)} ligand(s): {' '.join(cmd)}")
+            self._stream_vina(cmd, timeout=300 * len(jobs))
+            return self._collect_dir_poses(out_dir, jobs, receptor_str)
+
+    @staticmethod
+    def _collect_dir_poses(
+        out_dir: Path, jobs: List[Tuple[Path, Path]], receptor_str: str
+    ) -> List[DockingResult]:
+        """
+        Read back the <ligand stem>_out.pdbqt files of a batch run.
+
+        Batch runs print no per-ligand results table we can attribute, so
+        affinities come from the REMARK VINA RESULT lines; each pose file is
+        then moved to its requested output path.
+
+        Raises:
+            RuntimeError: If a ligand has no docked pose.
+        """
+        results = []
+        for ligand, output_pdbqt in jobs:
+            ligand = Path(ligand)
+            pose_file = out_dir / f"{ligand.stem}_out.pdbqt"
+            try:
+                poses = pose_file.read_text()
+            except OSError:
+                raise RuntimeError(f"Batch run produced no poses for {ligand}")
+            modes = [
+                (i, float(m.group(1)), float(m.group(2)), float(m.group(3)))
+                for i, m in enumerate(_VINA_RESULT_RE.finditer(poses), start=1)
+            ]
+            if not modes:
+                raise RuntimeError(f"Could not parse binding affinity for {ligand}")
+            Path(output_pdbqt).parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(pose_file), str(output_pdbqt))
+
+            _, affinity, rmsd_lb, rmsd_ub = modes[0]
+            logger.info(f"Docked {ligand.name}. Binding Affinity: {affinity} kcal/mol")
+            results.append(
+                DockingResult(
+                    binding_affinity=affinity,
+                    rmsd_lb=rmsd_lb,
+                    rmsd_ub=rmsd_ub,
+                    ligand_pdbqt=str(ligand),
+                    receptor_pdbqt=receptor_str,
+                    modes=modes,
+                )
+            )
+        return results
+
+    @staticmethod
+    def _grid_from_args(grid_args: list) -> Tuple[List[float], List[float]]:
+        """Convert Vina CLI grid arguments into (center, box_size) lists."""
+        opts = dict(zip(grid_args[::2], grid_args[1::2]))
+        center = [float(opts[f"--center_{axis}"]) for axis in "xyz"]
+        box_size = [float(opts[f"--size_{axis}"]) for axis in "xyz"]
+        return center, box_size
 
     def _apply_consensus_scoring(
         self,
         docking_result: DockingResult,
-        receptor_pdbqt: Path,
-        ligand_pdbqt: Path,
+        receptor_pdbqt: Union[str, Path],
+        ligand_pdbqt: Union[str, Path],
         grid_args: list,
         consensus_method: str = "mean",
     ) -> DockingResult:
@@ -183,9 +648,16 @@ class VinaWrapper:
         logger.info("Applying consensus scoring...")
 
         try:
-            scorer = ConsensusScorer()
+            if self._consensus_scorer is None:
+                self._consensus_scorer = ConsensusScorer()
+            scorer = self._consensus_scorer
             consensus_result = scorer.score(
-                receptor_pdbqt, ligand_pdbqt, grid_args, method=consensus_method
+                receptor_pdbqt,
+                ligand_pdbqt,
+                grid_args,
+                method=consensus_method,
+                # Docking already produced the Vina score; don't fork Vina again
+                precomputed={"vina": docking_result.binding_affinity},
             )
 
             docking_result.consensus_scores = consensus_result.individual_scores
@@ -203,32 +675,22 @@ class VinaWrapper:
         return docking_result
 
     @staticmethod
-    def _parse_affinity(output: str) -> float:
-        """Parse binding affinity (ΔG) from Vina output."""
-        # Vina 1.2.x prints a results table with affinity column
-        table_matches = re.findall(
-            r"^\s*\d+\s+([-+]?\d*\.?\d+(?:e[-+]?\d+)?)\s+",
-            output,
-            flags=re.MULTILINE | re.IGNORECASE,
-        )
-        for match in table_matches:
-            value = float(match)
-            if -200.0 < value < 50.0:
-                return value
-
-        # Legacy pattern: numeric value followed by kcal/mol
-        match = re.search(r"([-+]?\d*\.?\d+(?:e[-+]?\d+)?)\s+kcal/mol", output)
-        if match:
-            return float(match.group(1))
-
-        raise RuntimeError("Could not parse binding affinity from Vina output")
+    def _parse_table(output: str) -> List[Tuple[int, float, float, float]]:
+        """
+        Parse Vina results-table rows in a single pass.
 
-    @staticmethod
-    def _parse_rmsd(output: str) -> Tuple[float, float]:
-        """Parse RMSD values from Vina output."""
-        match = re.search(r"(RMSD\s+from\s+best\s+mode|lb|ub).*?(\d+\.\d+).*?(\d+\.\d+)", output)
-        # Simplified: return 0.0 if not found (Vina output format varies)
-        return 0.0, 0.0
+        Returns:
+            (mode, affinity, rmsd_lb, rmsd_ub) tuples in output order; the first
+            row is the best pose.
+        """
+        rows = []
+        for match in _TABLE_ROW_RE.finditer(output):
+            affinity = float(match.group(2))
+            if -200.0 < affinity < 50.0:
+                rows.append(
+                    (int(match.group(1)), affinity, float(match.group(3)), float(match.group(4)))
+                )
+        return rows
 
     def to_json(self, result: DockingResult) -> str:
         """
@@ -236,6 +698,37 @@ class VinaWrapper:
 
         Includes individual scores and consensus if available.
         """
+        output = self._result_dict(result)
+        if HAS_ORJSON:
+            return orjson.dumps(output).decode()
+        return json.dumps(output)
+
+    def write_jsonl(self, results: Iterable[DockingResult], output_path: Path) -> int:
+        """
+        Stream docking results to a JSON Lines file, one result per line.
+
+        Intended for dock_batch() output: results are written as they arrive, and
+        with orjson installed each line is encoded straight to bytes.
+
+        Returns:
+            Number of results written.
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        with open(output_path, "wb") as f:
+            for result in results:
+                output = self._result_dict(result)
+                if HAS_ORJSON:
+                    f.write(orjson.dumps(output, option=orjson.OPT_APPEND_NEWLINE))
+                else:
+                    f.write((json.dumps(output) + "\n").encode())
+                count += 1
+        return count
+
+    @staticmethod
+    def _result_dict(result: DockingResult) -> dict:
+        """Flatten a DockingResult into the MutationScan JSON schema."""
         output = {
             "binding_affinity_kcal_mol": result.binding_affinity,
             "rmsd_lb": result.rmsd_lb,
@@ -253,4 +746,4 @@ class VinaWrapper:
         else:
             output["consensus_mode"] = False
 
-        return json.dumps(output)
+        return output
@@ -1,22 +1,29 @@
 import typer
 from pathlib import Path
-import math
-import json
-import tempfile
-import shutil
 import sys
-from datetime import datetime
+import functools
+import hashlib
+import logging
+import os
+import re
 from typing import Optional
 
-from autoscan.docking.vina import VinaEngine
-from autoscan.core.prep import PrepareVina
-from autoscan.dynamics.minimizer import EnergyMinimizer, HAS_OPENMM
-from autoscan.utils.dependency_check import ensure_dependencies
+from autoscan import __version__
 from autoscan.utils.error_handler import ErrorHandler
 
+# Heavy modules (RDKit/Meeko via prep, OpenMM, numpy, Vina) are imported inside
+# the commands that need them, so --help and argument errors stay fast.
+
 app = typer.Typer()
 console = ErrorHandler()  # The Robustness Layer
 
+# One mutation: CHAIN:RESIDUE:FROM_AA:TO_AA (1- or 3-letter residue codes)
+_MUT_RE = re.compile(r"^([A-Za-z0-9]+):(-?\d+):([A-Za-z]+):([A-Za-z]+)$")
+
+# Content-addressed cache of prepared PDBQT files
+PREP_CACHE_DIR = Path.home() / ".cache" / "autoscan"
+PREP_CACHE_SUBDIRS = {"receptor": "receptors", "ligand": "ligands"}
+
 
 def validate_pdbqt_file(filepath: str, field_name: str) -> Path:
     """
@@ -27,15 +34,15 @@ def validate_pdbqt_file(filepath: str, field_name: str) -> Path:
         field_name: Name for error messages (e.g., "Receptor", "Ligand")
 
     Returns:
-        Path object if valid
+        Absolute, symlink-free Path if valid (callers needn't resolve it again)
 
     Raises:
         typer.BadParameter: If file is invalid or missing
     """
-    path = Path(filepath)
-
-    # Check if file exists
-    if not path.exists():
+    # strict resolve doubles as the existence check
+    try:
+        path = Path(filepath).resolve(strict=True)
+    except FileNotFoundError:
         raise typer.BadParameter(
             f"{field_name} file does not exist: {filepath}", param_hint=f"--{field_name.lower()}"
         )
@@ -47,7 +54,7 @@ def validate_pdbqt_file(filepath: str, field_name: str) -> Path:
         )
 
     # Check file extension
-    if path.suffix.lower() != ".pdbqt":
+    if str(filepath)[-6:].lower() != ".pdbqt":
         raise typer.BadParameter(
             f"{field_name} must be a .pdbqt file, got: {path.suffix}",
             param_hint=f"--{field_name.lower()}",
@@ -66,16 +73,74 @@ def validate_coordinates(center_x: float, center_y: float, center_z: float) -> N
     Raises:
         typer.BadParameter: If any coordinate is invalid
     """
-    coords = {"center_x": center_x, "center_y": center_y, "center_z": center_z}
+    # numpy is loaded for the receptor bounding-box check right after this anyway
+    import numpy as np
 
-    for name, value in coords.items():
-        if math.isnan(value) or math.isinf(value):
-            raise typer.BadParameter(
-                f"{name} must be a valid number, got: {value}", param_hint=f"--{name}"
-            )
+    coords = np.array([center_x, center_y, center_z], dtype=np.float64)
+    finite = np.isfinite(coords)
+    if not finite.all():
+        bad_idx = int(np.argmin(finite))
+        name = ("center_x", "center_y", "center_z")[bad_idx]
+        raise typer.BadParameter(
+            f"{name} must be a valid number, got: {coords[bad_idx]}", param_hint=f"--{name}"
+        )
+
+
+def validate_center_in_receptor(
+    pdb_path: Path, center_x: float, center_y: float, center_z: float, margin: float = 20.0
+) -> None:
+    """
+    Validate that the pocket center is near the receptor's atoms.
+
+    Reads the fixed x/y/z columns of ATOM/HETATM records (PDB and PDBQT share
+    them) into a bounding box. A center further than `margin` Å outside it is
+    almost always a typo, and Vina would spend minutes docking into empty space.
+    Files whose coordinates cannot be read are left to the docking step.
+
+    Args:
+        pdb_path: Receptor PDB or PDBQT file
+        center_x, center_y, center_z: Pocket center
+        margin: Allowed distance outside the bounding box (Å)
+
+    Raises:
+        typer.BadParameter: If the center lies outside the padded bounding box
+    """
+    import numpy as np
+
+    buf = np.frombuffer(Path(pdb_path).read_bytes(), dtype=np.uint8)
+    if buf.size == 0:
+        return
+    # Line start offsets; pad so fixed-width slices past EOF stay in bounds
+    starts = np.concatenate(([0], np.flatnonzero(buf == ord("\n")) + 1))
+    starts = starts[starts < buf.size]
+    buf = np.concatenate((buf, np.zeros(54, dtype=np.uint8)))
 
+    record = buf[starts[:, None] + np.arange(6)].view("S6").ravel()
+    atom_starts = starts[(record == b"ATOM  ") | (record == b"HETATM")]
+    if atom_starts.size == 0:
+        return  # no atom records
 
-def parse_mutation_string(mutation_str: str) -> list:
+    # Columns 30-54 hold three 8-character coordinate fields
+    fields = buf[atom_starts[:, None] + np.arange(30, 54)]
+    try:
+        xyz = fields.view("S8").astype(np.float64)
+    except ValueError:
+        return
+    lo = xyz.min(axis=0)
+    hi = xyz.max(axis=0)
+
+    center = (center_x, center_y, center_z)
+    if any(c < l - margin or c > h + margin for c, l, h in zip(center, lo, hi)):
+        box = ", ".join(f"{l:.1f}..{h:.1f}" for l, h in zip(lo, hi))
+        raise typer.BadParameter(
+            f"Pocket center ({center_x}, {center_y}, {center_z}) is more than {margin:g} Å "
+            f"outside the receptor bounding box ({box}) of {pdb_path}",
+            param_hint="--center-x/--center-y/--center-z",
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_mutation_string(mutation_str: str) -> tuple:
     """
     Parse mutation string in format: CHAIN:RESIDUE:FROM_AA:TO_AA
 
@@ -89,35 +154,47 @@ def parse_mutation_string(mutation_str: str) -> list:
         mutation_str: Mutation specification string (comma-separated for multiple)
 
     Returns:
-        List of tuples: [(chain_id, residue_num, from_aa, to_aa), ...]
+        Tuple of tuples: ((chain_id, residue_num, from_aa, to_aa), ...). Results are
+        memoized (mutation sweeps repeat specs), so the return value is immutable.
 
     Raises:
         typer.BadParameter: If format is invalid
     """
     mutations = []
-    try:
-        for m in mutation_str.split(","):
-            m = m.strip()
-            parts = m.split(":")
-            if len(parts) != 4:
-                raise ValueError("Expected format: CHAIN:RESIDUE:FROM_AA:TO_AA")
-            mutations.append((parts[0], int(parts[1]), parts[2], parts[3]))
-        return mutations
-    except (ValueError, IndexError) as e:
-        raise typer.BadParameter(
-            f"Invalid mutation format. Expected: CHAIN:RESIDUE:FROM_AA:TO_AA (e.g., A:87:D:G). "
-            f"For multiple mutations, use comma-separated: A:87:D:G,A:92:G:S. Got: {mutation_str}",
-            param_hint="--mutation",
-        )
+    for m in mutation_str.split(","):
+        match = _MUT_RE.match(m.strip())
+        if match is None:
+            raise typer.BadParameter(
+                f"Invalid mutation format. Expected: CHAIN:RESIDUE:FROM_AA:TO_AA (e.g., A:87:D:G). "
+                f"For multiple mutations, use comma-separated: A:87:D:G,A:92:G:S. Got: {mutation_str}",
+                param_hint="--mutation",
+            )
+        chain_id, residue_num, from_aa, to_aa = match.groups()
+        mutations.append((chain_id, int(residue_num), from_aa, to_aa))
+    return tuple(mutations)
 
 
-def convert_pdb_to_pdbqt(input_file: Path, molecule_type: str = "auto") -> Path:
+@functools.lru_cache(maxsize=4)
+def _get_prep(use_meeko: bool = True, ph: float = 7.4):
+    """Return a shared PrepareVina per configuration (Meeko setup is paid once)."""
+    from autoscan.core.prep import PrepareVina
+
+    return PrepareVina(use_meeko=use_meeko, ph=ph)
+
+
+def convert_pdb_to_pdbqt(
+    input_file: Path, molecule_type: str = "auto", force: bool = False
+) -> Path:
     """
     Convert PDB/SDF file to PDBQT using PrepareVina.
 
+    An existing PDBQT next to the input that is at least as new as the input is
+    reused as-is, as is a content-hash cache hit, unless force is set.
+
     Args:
         input_file: Path to PDB or SDF file
         molecule_type: Type of molecule ("receptor", "ligand", or "auto")
+        force: Always re-run preparation (refreshes both caches)
 
     Returns:
         Path to converted PDBQT file
@@ -125,13 +202,47 @@ def convert_pdb_to_pdbqt(input_file: Path, molecule_type: str = "auto") -> Path:
     Raises:
         typer.BadParameter: If conversion fails
     """
+    import shutil
+
     try:
-        prep = PrepareVina(use_meeko=True, ph=7.4)
+        output_file = input_file.with_suffix(".pdbqt")
+        if not force:
+            try:
+                if output_file.stat().st_mtime >= input_file.stat().st_mtime:
+                    console.log(f"  [OK] Using up-to-date {output_file.name}")
+                    return output_file
+            except FileNotFoundError:
+                pass
+
+        prep = _get_prep(True, 7.4)
+
+        # Preparation is deterministic in (input bytes, pH, backend, version), so
+        # screens against a fixed receptor only pay for it once.
+        backend = "meeko" if prep.use_meeko and prep.meeko_available else "obabel"
+        key = hashlib.sha1(
+            input_file.read_bytes() + f"{prep.ph}|{backend}|{molecule_type}|{__version__}".encode()
+        ).hexdigest()
+        cache_dir = PREP_CACHE_DIR / PREP_CACHE_SUBDIRS.get(molecule_type, "molecules")
+        cached = cache_dir / f"{key}.pdbqt"
+        if not force and cached.exists():
+            shutil.copyfile(cached, output_file)
+            console.log(f"  [OK] Reused cached PDBQT for {input_file.name}")
+            return output_file
+
         pdbqt_file = prep.pdb_to_pdbqt(
             input_file,
-            output_file=input_file.with_suffix(".pdbqt"),
+            output_file=output_file,
             molecule_type=molecule_type
         )
+
+        # Write-then-rename so concurrent runs never see a partial cache entry
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+            shutil.copyfile(pdbqt_file, tmp)
+            os.replace(tmp, cached)
+        except OSError as e:
+            console.warn(f"  [WARN] Could not cache prepared PDBQT: {e}")
         return Path(pdbqt_file)
     except Exception as e:
         raise typer.BadParameter(
@@ -139,21 +250,364 @@ def convert_pdb_to_pdbqt(input_file: Path, molecule_type: str = "auto") -> Path:
         )
 
 
+def _prepare_receptor(receptor: str, force_prep: bool = False, in_memory: bool = False) -> tuple:
+    """
+    Check a --receptor path and convert a PDB receptor to PDBQT.
+
+    Args:
+        receptor: Receptor path as given on the command line
+        force_prep: Re-run preparation even if an up-to-date PDBQT exists
+        in_memory: Convert a PDB receptor to PDBQT bytes instead of a file
+
+    Returns:
+        (receptor_path, receptor_bytes). receptor_bytes is None unless
+        in_memory converted a PDB, in which case receptor_path is that PDB.
+
+    Raises:
+        typer.BadParameter: If the file is missing, not .pdb/.pdbqt, or fails to convert
+    """
+    receptor_path = Path(receptor)
+    if not receptor_path.exists():
+        raise typer.BadParameter(
+            f"Receptor file does not exist: {receptor}", param_hint="--receptor"
+        )
+
+    # Extensions are matched on the lowercased path string; no PurePath parsing
+    receptor_lower = receptor.lower()
+    if receptor_lower.endswith(".pdb"):
+        console.log("  Converting receptor PDB → PDBQT...")
+        if in_memory:
+            receptor_bytes = _get_prep(True, 7.4).pdb_to_pdbqt_str(
+                receptor_path, molecule_type="receptor"
+            )
+            return receptor_path, receptor_bytes
+        receptor_path = convert_pdb_to_pdbqt(
+            receptor_path, molecule_type="receptor", force=force_prep
+        )
+    elif not receptor_lower.endswith(".pdbqt"):
+        raise typer.BadParameter(
+            f"Receptor must be .pdb or .pdbqt, got: {receptor_path.suffix}",
+            param_hint="--receptor",
+        )
+    return receptor_path, None
+
+
+def resolve_vina_executable(engine: str = "vina") -> Optional[str]:
+    """
+    Pick the docking binary for an engine.
+
+    For plain Vina, prefer the repo-local tools/ binary, falling back to 'vina'
+    on PATH. Other engines return None so VinaWrapper looks up their own binary.
+    """
+    from autoscan.engine.vina import ENGINE_EXECUTABLES
+
+    if engine not in ENGINE_EXECUTABLES and engine != "auto":
+        raise typer.BadParameter(
+            f"Unknown engine: {engine}. Choose from: {', '.join(ENGINE_EXECUTABLES)}, auto",
+            param_hint="--engine",
+        )
+    if engine != "vina":
+        return None
+    vina_local = (
+        Path(__file__).parent.parent.parent
+        / "tools"
+        / ("vina.exe" if sys.platform.startswith("win") else "vina")
+    )
+    if vina_local.exists():
+        return str(vina_local)
+    return "vina"
+
+
+def _result_row(docking_result) -> dict:
+    """Flatten a DockingResult into one row of a batch results file."""
+    row = {
+        "ligand": docking_result.ligand_pdbqt,
+        "binding_affinity_kcal_mol": float(docking_result.binding_affinity),
+    }
+    if docking_result.consensus_affinity is not None:
+        row["consensus_affinity_kcal_mol"] = docking_result.consensus_affinity
+        row["consensus_uncertainty_kcal_mol"] = docking_result.consensus_uncertainty
+        row["individual_scores"] = docking_result.consensus_scores
+    return row
+
+
+def _dock_one(
+    receptor_pdbqt: str,
+    ligand_pdbqt: str,
+    center: tuple,
+    vina_exe: Optional[str],
+    cpu: int,
+    engine: str = "vina",
+    flex_pdbqt: Optional[str] = None,
+    use_consensus: bool = False,
+    consensus_method: str = "mean",
+) -> dict:
+    """
+    Dock a single ligand in a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it; each worker builds its
+    own VinaEngine (and verifies its own binary).
+    """
+    from autoscan.docking.vina import VinaEngine
+
+    vina_engine = VinaEngine(receptor_pdbqt, ligand_pdbqt, vina_executable=vina_exe, engine=engine)
+    docking_result = vina_engine.run(
+        center=list(center),
+        cpu=cpu,
+        use_consensus=use_consensus,
+        consensus_method=consensus_method,
+        flex_pdbqt=flex_pdbqt,
+    )
+    return _result_row(docking_result)
+
+
+def _timestamp() -> str:
+    """ISO-8601 wall-clock timestamp (second precision) for saved results."""
+    from datetime import datetime
+
+    return datetime.now().isoformat(timespec="seconds")
+
+
 def save_results_json(results: dict, output_file: Path) -> None:
-    """Save docking results to JSON file."""
+    """Save docking results to JSON file (orjson when installed, else stdlib json)."""
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w") as f:
-        json.dump(results, f, indent=2)
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        with open(output_file, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        # Same indented layout; numpy scalars serialize natively
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     console.log(f"[OK] Results saved to: {output_file}")
 
 
+LIGAND_SUFFIXES = (".pdb", ".sdf", ".pdbqt")
+
+
+def collect_ligands(ligands_dir: Optional[str], ligand_list: Optional[str]) -> list:
+    """
+    Resolve --ligands-dir / --ligand-list into ligand paths.
+
+    Relative entries in a ligand list are resolved against the list's directory.
+    In a directory, a PDB/SDF source shadows a same-named PDBQT (its conversion
+    output) and earlier poses (*_docked.pdbqt) are skipped.
+
+    Raises:
+        typer.BadParameter: If the source is missing or yields no ligands
+    """
+    if ligands_dir is not None:
+        directory = Path(ligands_dir)
+        if not directory.is_dir():
+            raise typer.BadParameter(
+                f"Ligand directory does not exist: {ligands_dir}", param_hint="--ligands-dir"
+            )
+        by_stem = {}
+        for path in sorted(directory.iterdir()):
+            suffix = path.suffix.lower()
+            if suffix not in LIGAND_SUFFIXES or path.stem.endswith("_docked"):
+                continue
+            if suffix != ".pdbqt" or path.stem not in by_stem:
+                by_stem[path.stem] = path
+        ligands = list(by_stem.values())
+        hint = "--ligands-dir"
+    else:
+        list_path = Path(ligand_list)
+        if not list_path.is_file():
+            raise typer.BadParameter(
+                f"Ligand list does not exist: {ligand_list}", param_hint="--ligand-list"
+            )
+        ligands = [
+            list_path.parent / line.strip()
+            for line in list_path.read_text().splitlines()
+            if line.strip()
+        ]
+        hint = "--ligand-list"
+        for path in ligands:
+            if not path.exists():
+                raise typer.BadParameter(f"Ligand file does not exist: {path}", param_hint=hint)
+
+    if not ligands:
+        raise typer.BadParameter("No ligands found", param_hint=hint)
+    return ligands
+
+
+def _dock_ligand_set(
+    receptor_pdbqt: str,
+    ligand_paths: list,
+    center: list,
+    vina_exe: Optional[str],
+    engine: str,
+    workers: int,
+    use_consensus: bool,
+    consensus_method: str,
+    flex_path: Optional[Path],
+    output: Optional[str],
+    summary: dict,
+) -> None:
+    """
+    Dock a ligand set against one receptor and report/save the results.
+
+    With more than one worker, ligands are spread over a process pool, each
+    Vina run pinned to a single thread so workers don't oversubscribe cores.
+    A single worker reuses one VinaEngine: plain docking goes through
+    VinaEngine.run_batch so receptor maps are built once, while consensus
+    scoring and flexible side chains need the per-ligand path. A ligand that
+    fails is recorded as a {"ligand", "error"} row and the rest still dock.
+    """
+    from autoscan.docking.vina import VinaEngine
+
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        flex_str = str(flex_path) if flex_path else None
+        rows = [None] * len(ligand_paths)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _dock_one, receptor_pdbqt, str(lig), tuple(center), vina_exe, 1, engine,
+                    flex_str, use_consensus, consensus_method,
+                ): idx
+                for idx, lig in enumerate(ligand_paths)
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    row = future.result()
+                except Exception as e:
+                    lig = Path(ligand_paths[idx])
+                    console.warn(f"  [WARN] {lig.name}: docking failed - {e}")
+                    rows[idx] = {"ligand": str(lig), "error": str(e)}
+                    continue
+                console.log(
+                    f"  [OK] {Path(row['ligand']).name}: "
+                    f"{row['binding_affinity_kcal_mol']:.2f} kcal/mol"
+                )
+                rows[idx] = row
+    else:
+        vina_engine = VinaEngine(receptor_pdbqt, vina_executable=vina_exe, engine=engine)
+
+        def _dock(ligands):
+            if not (use_consensus or flex_path):
+                return vina_engine.run_batch([str(lig) for lig in ligands], center=center)
+
+            def _per_ligand():
+                for lig in ligands:
+                    vina_engine.set_ligand(str(lig))
+                    yield vina_engine.run(
+                        center=center,
+                        use_consensus=use_consensus,
+                        consensus_method=consensus_method,
+                        flex_pdbqt=flex_path,
+                    )
+
+            return _per_ligand()
+
+        rows = []
+        pending = list(ligand_paths)
+        while pending:
+            done = 0
+            try:
+                for docking_result in _dock(pending):
+                    row = _result_row(docking_result)
+                    console.log(
+                        f"  [OK] {Path(row['ligand']).name}: "
+                        f"{row['binding_affinity_kcal_mol']:.2f} kcal/mol"
+                    )
+                    rows.append(row)
+                    done += 1
+                pending = []
+            except Exception as e:
+                # A failure stops the batch at the ligand being docked; record
+                # it and carry on with the ones after it
+                lig = Path(pending[done])
+                console.warn(f"  [WARN] {lig.name}: docking failed - {e}")
+                rows.append({"ligand": str(lig), "error": str(e)})
+                pending = pending[done + 1 :]
+
+    if output:
+        save_results_json({"timestamp": _timestamp(), **summary, "results": rows}, Path(output))
+
+    docked = [row for row in rows if "error" not in row]
+    message = f"\nBatch Docking Complete! {len(docked)}/{len(rows)} ligands docked"
+    if docked:
+        best = min(docked, key=lambda row: row["binding_affinity_kcal_mol"])
+        message += (
+            f". Best: {Path(best['ligand']).name} "
+            f"({best['binding_affinity_kcal_mol']:.2f} kcal/mol)"
+        )
+    console.success(message)
+    console.log("=" * 80)
+
+
+def _dock_fast(
+    receptor: str, ligand: str, center: tuple, output: Optional[str], engine: str
+) -> None:
+    """
+    Dock a ready PDBQT receptor/ligand pair with minimal setup.
+
+    Used by dock() when there is nothing to convert, mutate or rescore: no
+    PrepareVina, no conversion cache lookups, and a single summary line.
+    """
+    from autoscan.docking.vina import VinaEngine
+
+    try:
+        receptor_path = validate_pdbqt_file(receptor, "Receptor")
+        ligand_path = validate_pdbqt_file(ligand, "Ligand")
+        validate_coordinates(*center)
+        validate_center_in_receptor(receptor_path, *center)
+        vina_exe = resolve_vina_executable(engine)
+
+        receptor_str = str(receptor_path)
+        ligand_str = str(ligand_path)
+        docking_result = VinaEngine(
+            receptor_str, ligand_str, vina_executable=vina_exe, engine=engine
+        ).run(center=list(center))
+
+        if output:
+            save_results_json(
+                {
+                    "timestamp": _timestamp(),
+                    "receptor": receptor_str,
+                    "ligand": ligand_str,
+                    "binding_affinity_kcal_mol": docking_result.binding_affinity,
+                    "center": {"x": center[0], "y": center[1], "z": center[2]},
+                    "mutation": "WT",
+                    "minimized": False,
+                    "consensus_mode": False,
+                },
+                Path(output),
+            )
+
+        console.success(
+            f"Docking Complete! Binding Affinity: {docking_result.binding_affinity:.2f} kcal/mol"
+        )
+
+    except typer.BadParameter:
+        raise
+    except Exception as e:
+        console.error(f"Docking Failed: {str(e)}")
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def dock(
     receptor: str = typer.Option(..., help="Path to Receptor (PDB or PDBQT)", metavar="RECEPTOR"),
-    ligand: str = typer.Option(..., help="Path to Ligand (PDB, SDF, or PDBQT)", metavar="LIGAND"),
+    ligand: Optional[str] = typer.Option(
+        None, help="Path to Ligand (PDB, SDF, or PDBQT)", metavar="LIGAND"
+    ),
     center_x: float = typer.Option(..., help="Binding pocket center X coordinate", metavar="X"),
     center_y: float = typer.Option(..., help="Binding pocket center Y coordinate", metavar="Y"),
     center_z: float = typer.Option(..., help="Binding pocket center Z coordinate", metavar="Z"),
+    ligands_dir: Optional[str] = typer.Option(
+        None, help="Dock every PDB/SDF/PDBQT ligand in this directory (batch mode)", metavar="DIR"
+    ),
+    ligand_list: Optional[str] = typer.Option(
+        None, help="Text file listing ligand paths, one per line (batch mode)", metavar="LIST.txt"
+    ),
     mutation: Optional[str] = typer.Option(
         None, help="Mutation: CHAIN:RESIDUE:FROM_AA:TO_AA (e.g., A:87:D:G)", metavar="MUTATION"
     ),
@@ -184,6 +638,27 @@ def dock(
         help="Backbone restraint strength (kJ/mol/nm²) for minimization. 500.0 prevents pocket collapse.",
         metavar="STIFFNESS"
     ),
+    engine: str = typer.Option(
+        "vina",
+        help="Docking engine: vina, qvina2, smina, unidock (GPU), or auto",
+        metavar="BACKEND",
+    ),
+    force_prep: bool = typer.Option(
+        False, "--force-prep", help="Re-run PDBQT preparation even if an up-to-date file exists"
+    ),
+    workers: int = typer.Option(
+        0,
+        help="Parallel docking processes in batch mode (0 = half the CPU count)",
+        metavar="N",
+    ),
+    no_write_intermediates: bool = typer.Option(
+        False,
+        "--no-write-intermediates",
+        help="Convert PDB/SDF inputs in memory instead of writing PDBQT files next to them",
+    ),
+    quiet: bool = typer.Option(
+        False, "--quiet", "-q", help="Only print warnings, errors and the final result"
+    ),
 ):
     """
     Run the AutoScan Docking Protocol.
@@ -211,191 +686,500 @@ def dock(
             --center-x 10.5 --center-y 20.3 --center-z 15.8 \\
             --use-consensus --consensus-method weighted \\
             --flex flexible_residues.pdbqt --output result.json
+
+        Batch mode (one receptor setup, receptor maps computed once):
+        $ autoscan dock --receptor protein.pdb --ligands-dir ligands/ \\
+            --center-x 10.5 --center-y 20.3 --center-z 15.8 --output screen.json
     """
+    console.quiet = quiet
+    # Engine/prep module loggers inherit the package level; silence their INFO
+    # chatter in one switch and restore it for whatever runs next in-process
+    package_logger = logging.getLogger("autoscan")
+    previous_level = package_logger.level
+    package_logger.setLevel(logging.WARNING if quiet else logging.INFO)
     try:
-        console.log("=" * 80)
-        console.log("Initializing AutoScan Docking Module...")
-        console.log("=" * 80)
+        # Pre-prepared PDBQT pair with nothing to convert, mutate or rescore. Only
+        # when --ligand is the sole ligand source; mixed sources are rejected below
+        if (
+            ligand is not None
+            and ligands_dir is None
+            and ligand_list is None
+            and receptor.lower().endswith(".pdbqt")
+            and ligand.lower().endswith(".pdbqt")
+            and not (mutation or flex or use_consensus)
+        ):
+            _dock_fast(receptor, ligand, (center_x, center_y, center_z), output, engine)
+            return
 
-        # ====== INPUT VALIDATION (Integrity Check) ======
-        console.log("\n[1/4] Validating Input Files...")
-        receptor_path = Path(receptor)
-        ligand_path = Path(ligand)
+        # OpenMM is only loaded when minimization was asked for
+        HAS_OPENMM = False
+        if minimize:
+            from autoscan.dynamics.minimizer import EnergyMinimizer, HAS_OPENMM
 
-        # Check existence
-        if not receptor_path.exists():
-            raise typer.BadParameter(
-                f"Receptor file does not exist: {receptor}", param_hint="--receptor"
-            )
-        if not ligand_path.exists():
-            raise typer.BadParameter(f"Ligand file does not exist: {ligand}", param_hint="--ligand")
-
-        # Convert PDB/SDF to PDBQT if needed (with context-aware molecule routing)
-        if receptor_path.suffix.lower() == ".pdb":
-            console.log("  Converting receptor PDB → PDBQT...")
-            receptor_path = convert_pdb_to_pdbqt(receptor_path, molecule_type="receptor")
-        elif receptor_path.suffix.lower() != ".pdbqt":
-            raise typer.BadParameter(
-                f"Receptor must be .pdb or .pdbqt, got: {receptor_path.suffix}",
-                param_hint="--receptor",
-            )
-
-        if ligand_path.suffix.lower() in [".pdb", ".sdf"]:
-            console.log(f"  Converting ligand {ligand_path.suffix.upper()} → PDBQT...")
-            ligand_path = convert_pdb_to_pdbqt(ligand_path, molecule_type="ligand")
-        elif ligand_path.suffix.lower() != ".pdbqt":
-            raise typer.BadParameter(
-                f"Ligand must be .pdb, .sdf, or .pdbqt, got: {ligand_path.suffix}",
-                param_hint="--ligand"
-            )
-
-        # Handle mutations if specified (supports epistatic networks)
-        if mutation:
-            console.log(f"\n  Applying mutations: {mutation}...")
-            mutations_list = parse_mutation_string(mutation)
+        try:
+            console.log("=" * 80)
+            console.log("Initializing AutoScan Docking Module...")
+            console.log("=" * 80)
 
-            # Read original PDB (before PDBQT conversion)
-            original_pdb = Path(receptor).with_suffix(".pdb")
-            if not original_pdb.exists():
+            # ====== INPUT VALIDATION (Integrity Check) ======
+            console.log("\n[1/4] Validating Input Files...")
+            if sum(arg is not None for arg in (ligand, ligands_dir, ligand_list)) != 1:
                 raise typer.BadParameter(
-                    f"Cannot apply mutation: original PDB file not found. Expected: {original_pdb}",
-                    param_hint="--mutation",
+                    "Provide exactly one of --ligand, --ligands-dir or --ligand-list",
+                    param_hint="--ligand",
                 )
+            batch_mode = ligand is None
+            if batch_mode and no_write_intermediates:
+                raise typer.BadParameter(
+                    "--no-write-intermediates is only supported with a single --ligand",
+                    param_hint="--no-write-intermediates",
+                )
+            # In-memory PDBQT (--no-write-intermediates); None means read the *_path file
+            ligand_bytes = None
+
+            # Determine docking executable (also rejects unknown --engine values)
+            vina_exe = resolve_vina_executable(engine)
 
-            # Apply mutations sequentially
-            prep = PrepareVina()
-            mutant_pdb = original_pdb
-            for idx, (chain_id, residue_num, from_aa, to_aa) in enumerate(mutations_list, 1):
-                console.log(f"    [{idx}/{len(mutations_list)}] Mutating {chain_id}:{residue_num} {from_aa}→{to_aa}...")
-                mutant_pdb = prep.mutate_residue(mutant_pdb, chain_id, residue_num, to_aa)
-            console.log(f"  [OK] All {len(mutations_list)} mutations applied. Final structure: {mutant_pdb}")
-
-            # Energy minimization (optional, requires OpenMM)
-            if minimize:
-                if HAS_OPENMM:
-                    console.log(f"  Minimizing mutant structure energy...")
-                    try:
-                        minimizer = EnergyMinimizer()
-                        minimized_pdb = minimizer.minimize(
-                            Path(mutant_pdb),
-                            stiffness=stiffness,
-                            output_path=Path(mutant_pdb).with_stem(
-                                Path(mutant_pdb).stem + "_minimized"
-                            ),
+            # Check existence; a PDB receptor is converted to PDBQT here
+            receptor_path, receptor_bytes = _prepare_receptor(
+                receptor, force_prep, in_memory=no_write_intermediates
+            )
+            if batch_mode:
+                ligand_paths = collect_ligands(ligands_dir, ligand_list)
+            else:
+                ligand_paths = [Path(ligand)]
+                if not ligand_paths[0].exists():
+                    raise typer.BadParameter(
+                        f"Ligand file does not exist: {ligand}", param_hint="--ligand"
+                    )
+
+            # Self-docking (--receptor and --ligand are the same file) converts only once
+            same_input = not batch_mode and Path(receptor).samefile(ligand_paths[0])
+
+            # Convert ligand PDB/SDF to PDBQT if needed (with context-aware molecule routing)
+            if same_input:
+                ligand_paths[0] = receptor_path
+                ligand_bytes = receptor_bytes
+            else:
+                for i, ligand_path in enumerate(ligand_paths):
+                    ligand_lower = str(ligand_path).lower()
+                    if ligand_lower.endswith((".pdb", ".sdf")):
+                        console.log(f"  Converting ligand {ligand_lower[-4:].upper()} → PDBQT...")
+                        if no_write_intermediates:
+                            ligand_bytes = _get_prep(True, 7.4).pdb_to_pdbqt_str(
+                                ligand_path, molecule_type="ligand"
+                            )
+                        else:
+                            ligand_paths[i] = convert_pdb_to_pdbqt(
+                                ligand_path, molecule_type="ligand", force=force_prep
+                            )
+                    elif not ligand_lower.endswith(".pdbqt"):
+                        raise typer.BadParameter(
+                            f"Ligand must be .pdb, .sdf, or .pdbqt, got: {ligand_path.suffix}",
+                            param_hint="--ligand"
                         )
-                        mutant_pdb = minimized_pdb
-                        console.log(f"  [OK] Minimization complete: {minimized_pdb}")
-                    except Exception as e:
+
+            # Handle mutations if specified (supports epistatic networks)
+            if mutation:
+                console.log(f"\n  Applying mutations: {mutation}...")
+                mutations_list = parse_mutation_string(mutation)
+
+                # Read original PDB (before PDBQT conversion)
+                original_pdb = Path(receptor).with_suffix(".pdb")
+                if not original_pdb.exists():
+                    raise typer.BadParameter(
+                        f"Cannot apply mutation: original PDB file not found. Expected: {original_pdb}",
+                        param_hint="--mutation",
+                    )
+
+                # Apply mutations sequentially
+                prep = _get_prep(True, 7.4)
+                mutant_pdb = original_pdb
+                for idx, (chain_id, residue_num, from_aa, to_aa) in enumerate(mutations_list, 1):
+                    console.log(f"    [{idx}/{len(mutations_list)}] Mutating {chain_id}:{residue_num} {from_aa}→{to_aa}...")
+                    mutant_pdb = prep.mutate_residue(mutant_pdb, chain_id, residue_num, to_aa)
+                console.log(f"  [OK] All {len(mutations_list)} mutations applied. Final structure: {mutant_pdb}")
+
+                # Energy minimization (optional, requires OpenMM)
+                if minimize:
+                    if HAS_OPENMM:
+                        console.log(f"  Minimizing mutant structure energy...")
+                        try:
+                            minimizer = EnergyMinimizer()
+                            minimized_pdb = minimizer.minimize(
+                                Path(mutant_pdb),
+                                stiffness=stiffness,
+                                output_path=Path(mutant_pdb).with_stem(
+                                    Path(mutant_pdb).stem + "_minimized"
+                                ),
+                            )
+                            mutant_pdb = minimized_pdb
+                            console.log(f"  [OK] Minimization complete: {minimized_pdb}")
+                        except Exception as e:
+                            console.warn(
+                                f"  [WARN] Minimization failed: {str(e)} - proceeding with non-minimized structure"
+                            )
+                    else:
                         console.warn(
-                            f"  [WARN] Minimization failed: {str(e)} - proceeding with non-minimized structure"
+                            f"  [WARN] Minimization requested but OpenMM not installed - skipping"
                         )
+
+                # Convert mutant PDB to PDBQT
+                if no_write_intermediates:
+                    receptor_path = Path(mutant_pdb)
+                    receptor_bytes = _get_prep(True, 7.4).pdb_to_pdbqt_str(
+                        receptor_path, molecule_type="receptor"
+                    )
                 else:
-                    console.warn(
-                        f"  [WARN] Minimization requested but OpenMM not installed - skipping"
+                    receptor_path = convert_pdb_to_pdbqt(
+                        mutant_pdb, molecule_type="receptor", force=force_prep
                     )
+                console.log(f"  [OK] Mutant structure prepared: {receptor_path}")
 
-            # Convert mutant PDB to PDBQT
-            receptor_path = convert_pdb_to_pdbqt(mutant_pdb, molecule_type="receptor")
-            console.log(f"  [OK] Mutant structure prepared: {receptor_path}")
+            console.log("\n[2/4] Validating Coordinates...")
+            validate_coordinates(center_x, center_y, center_z)
+            validate_center_in_receptor(receptor_path, center_x, center_y, center_z)
 
-        console.log("\n[2/4] Validating Coordinates...")
-        validate_coordinates(center_x, center_y, center_z)
+            # Inputs are final from here on; stringify them once
+            receptor_str = str(receptor_path)
+            ligand_str = str(ligand_paths[0])
 
-        console.log("\n[OK] Receptor: " + str(receptor_path))
-        console.log("[OK] Ligand:   " + str(ligand_path))
-        console.log(f"[OK] Center:   ({center_x}, {center_y}, {center_z})")
-        if mutation:
-            console.log(f"[OK] Mutation: {mutation}")
-        if use_consensus:
-            console.log(f"[OK] Consensus Scoring: Enabled ({consensus_method})")
-        if flex:
-            console.log(f"[OK] Flexible Docking: {flex}")
-        if mutation:
-            if HAS_OPENMM and minimize:
-                console.log(f"[OK] Energy Minimization: Enabled ({minimize_iterations} iterations)")
+            console.log("\n[OK] Receptor: " + receptor_str)
+            if batch_mode:
+                console.log(f"[OK] Ligands:  {len(ligand_paths)}")
             else:
-                console.log(
-                    f"[WARN] Energy Minimization: Requested but OpenMM not installed (will skip)"
-                )
+                console.log("[OK] Ligand:   " + ligand_str)
+            console.log(f"[OK] Center:   ({center_x}, {center_y}, {center_z})")
+            if mutation:
+                console.log(f"[OK] Mutation: {mutation}")
+            if use_consensus:
+                console.log(f"[OK] Consensus Scoring: Enabled ({consensus_method})")
+            if flex:
+                console.log(f"[OK] Flexible Docking: {flex}")
+            if mutation:
+                if HAS_OPENMM and minimize:
+                    console.log(
+                        f"[OK] Energy Minimization: Enabled ({minimize_iterations} iterations)"
+                    )
+                else:
+                    console.log(
+                        f"[WARN] Energy Minimization: Requested but OpenMM not installed (will skip)"
+                    )
 
-        console.log("\n[3/4] Checking Dependencies...")
-        # Ensure Vina is available (only critical dependency for docking)
-        # Other tools (obabel, pdbfixer, openmm) are optional
-        try:
-            from autoscan.docking.vina import VinaEngine
+            console.log("\n[3/4] Checking Dependencies...")
+            # Ensure Vina is available (only critical dependency for docking)
+            # Other tools (obabel, pdbfixer, openmm) are optional
+            try:
+                from autoscan.docking.vina import VinaEngine
 
-            console.log("[OK] Vina engine available")
-        except Exception as e:
-            raise typer.Exit(f"[ERROR] Vina docking engine not available: {e}")
+                console.log("[OK] Vina engine available")
+            except Exception as e:
+                raise typer.Exit(f"[ERROR] Vina docking engine not available: {e}")
 
-        console.log("\n[4/4] Running Docking Engine...")
+            console.log("\n[4/4] Running Docking Engine...")
 
-        # Validate flex file if provided
-        flex_path = None
-        if flex:
-            flex_path = Path(flex)
-            if not flex_path.exists():
-                raise typer.BadParameter(
-                    f"Flexible residues file does not exist: {flex}", param_hint="--flex"
-                )
-            if flex_path.suffix.lower() != ".pdbqt":
-                raise typer.BadParameter(
-                    f"Flex file must be .pdbqt, got: {flex_path.suffix}", param_hint="--flex"
+            # Validate flex file if provided
+            flex_path = None
+            if flex:
+                flex_path = Path(flex)
+                if not flex_path.exists():
+                    raise typer.BadParameter(
+                        f"Flexible residues file does not exist: {flex}", param_hint="--flex"
+                    )
+                if not flex.lower().endswith(".pdbqt"):
+                    raise typer.BadParameter(
+                        f"Flex file must be .pdbqt, got: {flex_path.suffix}", param_hint="--flex"
+                    )
+
+            if batch_mode:
+                _dock_ligand_set(
+                    receptor_str,
+                    ligand_paths,
+                    center=[center_x, center_y, center_z],
+                    vina_exe=vina_exe,
+                    engine=engine,
+                    workers=workers or max(1, (os.cpu_count() or 1) // 2),
+                    use_consensus=use_consensus,
+                    consensus_method=consensus_method,
+                    flex_path=flex_path,
+                    output=output,
+                    summary={
+                        "receptor": receptor_str,
+                        "center": {"x": center_x, "y": center_y, "z": center_z},
+                        "mutation": mutation if mutation else "WT",
+                        "minimized": minimize and HAS_OPENMM,
+                    },
                 )
+                return
 
-        # Determine Vina executable path
-        vina_exe = "vina"  # Default: look in PATH
-        vina_local = (
-            Path(__file__).parent.parent.parent
-            / "tools"
-            / ("vina.exe" if sys.platform.startswith("win") else "vina")
-        )
-        if vina_local.exists():
-            vina_exe = str(vina_local)
+            vina_engine = VinaEngine(
+                receptor_str,
+                ligand_str,
+                vina_executable=vina_exe,
+                engine=engine,
+                receptor_pdbqt_bytes=receptor_bytes,
+                ligand_pdbqt_bytes=ligand_bytes,
+            )
+            docking_result = vina_engine.run(
+                center=[center_x, center_y, center_z],
+                use_consensus=use_consensus,
+                consensus_method=consensus_method,
+                flex_pdbqt=flex_path,
+                # Staged ligands live on tmpfs; keep the docked pose next to the source
+                output_pdbqt=(
+                    str(ligand_paths[0].with_name(ligand_paths[0].stem + "_docked.pdbqt"))
+                    if ligand_bytes is not None
+                    else None
+                ),
+            )
 
-        engine = VinaEngine(str(receptor_path), str(ligand_path), vina_executable=vina_exe)
-        docking_result = engine.run(
-            center=[center_x, center_y, center_z],
-            use_consensus=use_consensus,
-            consensus_method=consensus_method,
-            flex_pdbqt=flex_path,
-        )
+            consensus_mode = use_consensus and docking_result.consensus_affinity is not None
+            if consensus_mode:
+                success_msg = f"Docking Complete! Consensus Affinity: {docking_result.consensus_affinity:.2f} ± {docking_result.consensus_uncertainty:.2f} kcal/mol"
+            else:
+                success_msg = f"Docking Complete! Binding Affinity: {docking_result.binding_affinity:.2f} kcal/mol"
 
-        # Prepare results
-        results = {
-            "timestamp": datetime.now().isoformat(),
-            "receptor": str(receptor_path),
-            "ligand": str(ligand_path),
-            "binding_affinity_kcal_mol": float(docking_result.binding_affinity),
-            "center": {"x": center_x, "y": center_y, "z": center_z},
-            "mutation": mutation if mutation else "WT",
-            "minimized": minimize and HAS_OPENMM,
-        }
-
-        # Add consensus scores if available
-        if use_consensus and docking_result.consensus_affinity is not None:
-            results["consensus_mode"] = True
-            results["consensus_affinity_kcal_mol"] = float(docking_result.consensus_affinity)
-            results["consensus_uncertainty_kcal_mol"] = float(docking_result.consensus_uncertainty)
-            results["individual_scores"] = docking_result.consensus_scores
-            success_msg = f"Docking Complete! Consensus Affinity: {docking_result.consensus_affinity:.2f} ± {docking_result.consensus_uncertainty:.2f} kcal/mol"
-        else:
-            results["consensus_mode"] = False
-            success_msg = f"Docking Complete! Binding Affinity: {docking_result.binding_affinity:.2f} kcal/mol"
-
-        # Save results if output specified
-        if output:
-            save_results_json(results, Path(output))
+            # Results are only assembled when they are going to be saved
+            if output:
+                results = {
+                    "timestamp": _timestamp(),
+                    "receptor": receptor_str,
+                    "ligand": ligand_str,
+                    "binding_affinity_kcal_mol": docking_result.binding_affinity,
+                    "center": {"x": center_x, "y": center_y, "z": center_z},
+                    "mutation": mutation if mutation else "WT",
+                    "minimized": minimize and HAS_OPENMM,
+                    "consensus_mode": consensus_mode,
+                }
+                if consensus_mode:
+                    results["consensus_affinity_kcal_mol"] = docking_result.consensus_affinity
+                    results["consensus_uncertainty_kcal_mol"] = docking_result.consensus_uncertainty
+                    results["individual_scores"] = docking_result.consensus_scores
+                save_results_json(results, Path(output))
+
+            console.success(f"\n{success_msg}")
+            console.log("=" * 80)
 
-        console.success(f"\n{success_msg}")
+        except typer.BadParameter:
+            # Re-raise Typer validation errors (will show clean error message)
+            raise
+        except Exception as e:
+            console.error(f"Docking Failed: {str(e)}")
+            raise typer.Exit(code=1)
+    finally:
+        package_logger.setLevel(previous_level)
+
+
+@app.command("dock-batch")
+def dock_batch(
+    receptor: str = typer.Option(..., help="Path to Receptor (PDB or PDBQT)", metavar="RECEPTOR"),
+    ligand_dir: str = typer.Option(
+        ..., help="Directory of PDB/SDF/PDBQT ligands to screen", metavar="DIR"
+    ),
+    center_x: float = typer.Option(..., help="Binding pocket center X coordinate", metavar="X"),
+    center_y: float = typer.Option(..., help="Binding pocket center Y coordinate", metavar="Y"),
+    center_z: float = typer.Option(..., help="Binding pocket center Z coordinate", metavar="Z"),
+    workers: int = typer.Option(
+        0, help="Parallel docking processes (0 = half the CPU count)", metavar="N"
+    ),
+    output: Optional[str] = typer.Option(
+        None, help="Output file for results (JSON format)", metavar="OUTPUT.json"
+    ),
+    engine: str = typer.Option(
+        "vina",
+        help="Docking engine: vina, qvina2, smina, unidock (GPU), or auto",
+        metavar="BACKEND",
+    ),
+    force_prep: bool = typer.Option(
+        False, "--force-prep", help="Re-run PDBQT preparation even if an up-to-date file exists"
+    ),
+):
+    """
+    Dock every ligand in a directory against one receptor, in parallel.
+
+    Shorthand for `autoscan dock --ligands-dir`: ligands are collected and
+    docked the same way (see _dock_ligand_set), and results keep directory order.
+
+    Example:
+        $ autoscan dock-batch --receptor protein.pdbqt --ligand-dir ligands/ \\
+            --center-x 10.5 --center-y 20.3 --center-z 15.8 --workers 8 --output screen.json
+    """
+    try:
+        console.log("=" * 80)
+        console.log("Initializing AutoScan Batch Docking...")
         console.log("=" * 80)
 
+        validate_coordinates(center_x, center_y, center_z)
+        vina_exe = resolve_vina_executable(engine)
+        receptor_path, _ = _prepare_receptor(receptor, force_prep)
+        validate_center_in_receptor(receptor_path, center_x, center_y, center_z)
+
+        try:
+            ligand_paths = collect_ligands(ligand_dir, None)
+        except typer.BadParameter as e:
+            e.param_hint = "--ligand-dir"
+            raise
+        ligand_paths = [
+            (
+                convert_pdb_to_pdbqt(path, molecule_type="ligand", force=force_prep)
+                if path.suffix.lower() != ".pdbqt"
+                else path
+            )
+            for path in ligand_paths
+        ]
+
+        console.log(f"[OK] Receptor: {receptor_path}")
+        console.log(f"[OK] Ligands:  {len(ligand_paths)} from {ligand_dir}")
+
+        _dock_ligand_set(
+            str(receptor_path),
+            ligand_paths,
+            center=[center_x, center_y, center_z],
+            vina_exe=vina_exe,
+            engine=engine,
+            workers=workers or max(1, (os.cpu_count() or 1) // 2),
+            use_consensus=False,
+            consensus_method="mean",
+            flex_path=None,
+            output=output,
+            summary={
+                "receptor": str(receptor_path),
+                "center": {"x": center_x, "y": center_y, "z": center_z},
+            },
+        )
+
     except typer.BadParameter:
-        # Re-raise Typer validation errors (will show clean error message)
         raise
     except Exception as e:
-        console.error(f"Docking Failed: {str(e)}")
+        console.error(f"Batch Docking Failed: {str(e)}")
+        raise typer.Exit(code=1)
+
+
+@app.command("dock-mpi")
+def dock_mpi(
+    receptor: str = typer.Option(..., help="Path to Receptor (PDB or PDBQT)", metavar="RECEPTOR"),
+    ligand_list: str = typer.Option(
+        ..., help="Text file listing one ligand PDBQT path per line", metavar="LIGANDS.txt"
+    ),
+    center_x: float = typer.Option(..., help="Binding pocket center X coordinate", metavar="X"),
+    center_y: float = typer.Option(..., help="Binding pocket center Y coordinate", metavar="Y"),
+    center_z: float = typer.Option(..., help="Binding pocket center Z coordinate", metavar="Z"),
+    cpu: int = typer.Option(1, help="Vina CPU threads per MPI rank", metavar="THREADS"),
+    output: Optional[str] = typer.Option(
+        None, help="Output file for results (JSON format)", metavar="OUTPUT.json"
+    ),
+    engine: str = typer.Option(
+        "vina",
+        help="Docking engine: vina, qvina2, smina, unidock (GPU), or auto",
+        metavar="BACKEND",
+    ),
+    force_prep: bool = typer.Option(
+        False, "--force-prep", help="Re-run PDBQT preparation even if an up-to-date file exists"
+    ),
+):
+    """
+    Dock a ligand list across MPI ranks (HPC virtual screening).
+
+    Rank 0 validates inputs and scatters the ligand list round-robin; every rank
+    docks its share and rank 0 gathers the compact per-ligand results.
+    Requires mpi4py and an MPI runtime.
+
+    Example:
+        $ mpirun -n 64 autoscan dock-mpi --receptor protein.pdbqt --ligand-list ligands.txt \\
+            --center-x 10.5 --center-y 20.3 --center-z 15.8 --output screen.json
+    """
+    try:
+        from mpi4py import MPI
+    except ImportError:
+        console.error("dock-mpi requires mpi4py: pip install mpi4py (and an MPI runtime)")
+        raise typer.Exit(code=1)
+
+    comm = MPI.COMM_WORLD
+    rank, size = comm.Get_rank(), comm.Get_size()
+
+    # Rank 0 validates; every rank must reach bcast, so errors are reported, not raised
+    header = None
+    chunks = None
+    if rank == 0:
+        try:
+            console.log("=" * 80)
+            console.log(f"Initializing AutoScan MPI Docking ({size} ranks)...")
+            console.log("=" * 80)
+
+            validate_coordinates(center_x, center_y, center_z)
+            vina_exe = resolve_vina_executable(engine)
+
+            receptor_path, _ = _prepare_receptor(receptor, force_prep)
+            validate_center_in_receptor(receptor_path, center_x, center_y, center_z)
+
+            # Relative entries resolve against the list's directory, as in dock
+            ligands = [str(path) for path in collect_ligands(None, ligand_list)]
+
+            console.log(f"[OK] Receptor: {receptor_path}")
+            console.log(f"[OK] Ligands:  {len(ligands)} across {size} ranks x {cpu} CPU")
+            header = (str(receptor_path), vina_exe, len(ligands))
+            chunks = [ligands[i::size] for i in range(size)]
+        except Exception as e:
+            console.error(f"MPI Docking Failed: {str(e)}")
+
+    header = comm.bcast(header, root=0)
+    if header is None:
+        raise typer.Exit(code=1)
+    receptor_pdbqt, vina_exe, n_ligands = header
+
+    my_ligands = comm.scatter(chunks, root=0)
+    center = (center_x, center_y, center_z)
+
+    # Rows stay small ({ligand, affinity} or {ligand, error}) to keep gather cheap
+    local_results = []
+    for lig in my_ligands:
+        try:
+            local_results.append(_dock_one(receptor_pdbqt, lig, center, vina_exe, cpu, engine))
+        except Exception as e:
+            console.warn(f"  [WARN] rank {rank}: {Path(lig).name}: docking failed - {e}")
+            local_results.append({"ligand": lig, "error": str(e)})
+
+    gathered = comm.gather(local_results, root=0)
+    if rank != 0:
+        return
+
+    batch_results = [row for rank_results in gathered for row in rank_results]
+    n_ok = sum(1 for row in batch_results if "error" not in row)
+    if output:
+        save_results_json(
+            {
+                "timestamp": _timestamp(),
+                "receptor": receptor_pdbqt,
+                "center": {"x": center_x, "y": center_y, "z": center_z},
+                "ranks": size,
+                "results": batch_results,
+            },
+            Path(output),
+        )
+
+    console.success(f"\nMPI Docking Complete! {n_ok}/{n_ligands} ligands docked")
+    console.log("=" * 80)
+
+
+@app.command("check-deps")
+def check_deps(
+    recheck_deps: bool = typer.Option(
+        False, "--recheck-deps", help="Ignore the cached result from a previous passing check"
+    ),
+):
+    """
+    Verify Python packages and external tools (Vina, OpenBabel, PDBFixer).
+
+    A passing result is cached per AutoScan version, so repeat runs return immediately.
+    """
+    from autoscan.utils import ensure_dependencies
+
+    try:
+        ensure_dependencies(recheck=recheck_deps)
+    except RuntimeError as e:
+        console.error(str(e))
         raise typer.Exit(code=1)
+    console.success("Dependency check: PASS")
 
 
 if __name__ == "__main__":
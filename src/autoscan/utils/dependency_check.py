@@ -1,13 +1,32 @@
+import functools
+import importlib
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from importlib import metadata
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+from autoscan import __version__
+
+try:
+    from packaging.version import Version as _Version
+except ImportError:
+    _Version = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
 
 _REQUIRED_PYTHON = {
     "openmm": {"op": "==", "version": "8.0.0"},
@@ -19,6 +38,8 @@ _REQUIRED_PYTHON = {
     "mdtraj": {"op": ">=", "version": "1.9.9"},
 }
 
+_REQUIRED_PYTHON_NAMES = frozenset(_REQUIRED_PYTHON)
+
 _REQUIRED_BINARIES = {
     "vina": {
         "label": "AutoDock Vina",
@@ -45,6 +66,16 @@ _PINNED_PYTHON = {
     "numpy": "1.24.3",
 }
 
+_REQUIREMENT_RE = re.compile(r"^([A-Za-z0-9_.-]+)(\[[^\]]+\])?\s*([<>=!~]{1,2})\s*([0-9][^;]*)")
+_NAME_SPLIT_RE = re.compile(r"[<=>]")
+_NAME_NORMALIZE_RE = re.compile(r"[-_.]+")
+_METADATA_VERSION_RE = re.compile(r"^Version:\s*(\S+)", re.MULTILINE)
+_VERSION_SPLIT_RE = re.compile(r"[^0-9]+")
+_VERSION_IN_OUTPUT_RE = re.compile(r"(\d+\.\d+\.\d+)")
+
+# Written after a passing ensure_dependencies(); one marker per package version
+_DEPS_MARKER = Path.home() / ".cache" / "autoscan" / f"deps_ok_{__version__}"
+
 
 def find_repo_root(start: Path) -> Path:
     for candidate in [start] + list(start.parents):
@@ -54,6 +85,21 @@ def find_repo_root(start: Path) -> Path:
 
 
 def _read_dependencies(pyproject_path: Path) -> List[str]:
+    # Keyed on mtime so an edited pyproject.toml is re-read within the same process
+    return list(_load_dependencies(str(pyproject_path), pyproject_path.stat().st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_dependencies(pyproject_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    if tomllib is None:
+        return tuple(_scan_dependencies(Path(pyproject_path)))
+    with open(pyproject_path, "rb") as f:
+        data = tomllib.load(f)
+    return tuple(data.get("project", {}).get("dependencies", []))
+
+
+def _scan_dependencies(pyproject_path: Path) -> List[str]:
+    # Minimal line scanner for interpreters without tomllib/tomli
     text = pyproject_path.read_text(encoding="utf-8")
     deps: List[str] = []
     in_block = False
@@ -71,14 +117,13 @@ def _read_dependencies(pyproject_path: Path) -> List[str]:
 
 
 def _parse_requirement(requirement: str) -> Tuple[str, Optional[str], Optional[str]]:
-    pattern = r"^([A-Za-z0-9_.-]+)(\[[^\]]+\])?\s*([<>=!~]{1,2})\s*([0-9][^;]*)"
-    match = re.match(pattern, requirement.strip())
+    match = _REQUIREMENT_RE.match(requirement.strip())
     if match:
         name = match.group(1)
         op = match.group(3)
         version = match.group(4).strip()
     else:
-        name = re.split(r"[<=>]", requirement, 1)[0]
+        name = _NAME_SPLIT_RE.split(requirement, 1)[0]
         op = None
         version = None
     name = name.strip().lower().replace("_", "-")
@@ -86,17 +131,25 @@ def _parse_requirement(requirement: str) -> Tuple[str, Optional[str], Optional[s
 
 
 def _version_tuple(version: str) -> Tuple[int, ...]:
-    parts = re.split(r"[^0-9]+", version)
+    parts = _VERSION_SPLIT_RE.split(version)
     return tuple(int(part) for part in parts if part)
 
 
-def _compare_versions(installed: str, required: str, op: str) -> bool:
-    try:
-        from packaging.version import Version
+@functools.lru_cache(maxsize=256)
+def _parse_version(version: str) -> Union["_Version", Tuple[int, ...]]:
+    if _Version is not None:
+        try:
+            return _Version(version)
+        except Exception:
+            pass
+    return _version_tuple(version)
 
-        left: Union["Version", Tuple[int, ...]] = Version(installed)
-        right: Union["Version", Tuple[int, ...]] = Version(required)
-    except Exception:
+
+def _compare_versions(installed: str, required: str, op: str) -> bool:
+    left = _parse_version(installed)
+    right = _parse_version(required)
+    if type(left) is not type(right):
+        # One side isn't PEP 440; compare both as plain integer tuples
         left = _version_tuple(installed)
         right = _version_tuple(required)
 
@@ -107,14 +160,31 @@ def _compare_versions(installed: str, required: str, op: str) -> bool:
     return False
 
 
+def _normalize_dist_name(name: str) -> str:
+    return _NAME_NORMALIZE_RE.sub("-", name).lower()
+
+
+# One pass over sys.path for every installed distribution instead of a
+# dist-info scan per metadata.version() call
+@functools.lru_cache(maxsize=1)
+def _installed_versions() -> Dict[str, str]:
+    versions: Dict[str, str] = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            # First match on sys.path wins, as with metadata.version()
+            versions.setdefault(_normalize_dist_name(name), dist.version)
+    return versions
+
+
 def _check_python_dependencies() -> List[str]:
     issues: List[str] = []
+    installed_versions = _installed_versions()
     for name, spec in _REQUIRED_PYTHON.items():
         op = spec["op"]
         version = spec["version"]
-        try:
-            installed = metadata.version(name)
-        except metadata.PackageNotFoundError:
+        installed = installed_versions.get(_normalize_dist_name(name))
+        if installed is None:
             issues.append(f"Missing Python dependency: {name} (required {op}{version})")
             continue
         if not _compare_versions(installed, version, op):
@@ -124,21 +194,29 @@ def _check_python_dependencies() -> List[str]:
     return issues
 
 
-def _check_manifest_in_pyproject(pyproject_path: Path) -> List[str]:
-    if not pyproject_path.exists():
-        return ["pyproject.toml not found; cannot verify dependency manifest."]
-
-    deps = _read_dependencies(pyproject_path)
+def _dependency_map(pyproject_path: Path) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
     dep_map: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
-    for requirement in deps:
+    for requirement in _read_dependencies(pyproject_path):
         name, op, version = _parse_requirement(requirement)
         dep_map[name] = (op, version)
+    return dep_map
+
+
+def _check_manifest_in_pyproject(
+    pyproject_path: Path,
+    dep_map: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None,
+) -> List[str]:
+    if dep_map is None:
+        if not pyproject_path.exists():
+            return ["pyproject.toml not found; cannot verify dependency manifest."]
+        dep_map = _dependency_map(pyproject_path)
 
+    missing = _REQUIRED_PYTHON_NAMES - dep_map.keys()
     issues: List[str] = []
     for name, spec in _REQUIRED_PYTHON.items():
         required_op = spec["op"]
         required_version = spec["version"]
-        if name not in dep_map:
+        if name in missing:
             issues.append(
                 f"pyproject.toml missing required dependency: {name} ({required_op}{required_version})"
             )
@@ -200,14 +278,23 @@ def _binary_install_hints(repo_root: Path) -> List[str]:
     return hints
 
 
+# PATH lookups and environment probes don't change within a process; tests can
+# reset them with <function>.cache_clear()
+@functools.lru_cache(maxsize=16)
+def _which_cached(name: str) -> Optional[str]:
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=1)
 def _conda_executable() -> Optional[str]:
     conda_exe = os.environ.get("CONDA_EXE")
-    if conda_exe and (Path(conda_exe).exists() or shutil.which(conda_exe)):
+    if conda_exe and (Path(conda_exe).exists() or _which_cached(conda_exe)):
         return conda_exe
-    resolved = shutil.which("conda")
+    resolved = _which_cached("conda")
     return resolved
 
 
+@functools.lru_cache(maxsize=1)
 def _in_conda_environment() -> bool:
     """Check if already running inside a conda environment."""
     return bool(os.environ.get("CONDA_PREFIX"))
@@ -225,30 +312,90 @@ def _conda_run(command: List[str]) -> subprocess.CompletedProcess[str]:
     return subprocess.run(cmd, capture_output=True, text=True, check=False)
 
 
-def _conda_package_version(package: str) -> Optional[str]:
+def _conda_env_roots() -> List[Path]:
+    roots = [Path(sys.prefix)]
+    conda_prefix = os.environ.get("CONDA_PREFIX")
+    if conda_prefix:
+        prefix = Path(conda_prefix)
+        roots.append(prefix.parent.parent if prefix.parent.name == "envs" else prefix)
+    conda_exe = _conda_executable()
+    if conda_exe:
+        roots.append(Path(conda_exe).resolve().parent.parent)
+    return list(dict.fromkeys(roots))
+
+
+def _conda_env_dist_version(package: str) -> Optional[str]:
+    # Read the package's dist-info METADATA from the tools env on disk instead of
+    # starting an interpreter there with `conda run`
+    patterns = (
+        f"lib/python*/site-packages/{package}-*.dist-info/METADATA",
+        f"Lib/site-packages/{package}-*.dist-info/METADATA",
+    )
+    for root in _conda_env_roots():
+        env_dir = root / "envs" / _CONDA_ENV_NAME
+        if not env_dir.is_dir():
+            continue
+        for pattern in patterns:
+            for meta in env_dir.glob(pattern):
+                try:
+                    match = _METADATA_VERSION_RE.search(meta.read_text(errors="ignore"))
+                except OSError:
+                    continue
+                if match:
+                    return match.group(1)
+    return None
+
+
+# One `conda list` answers every package lookup; conda's own startup dominates
+# the cost, so the listing is taken once (under a lock, since probes run in threads)
+_conda_list_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _conda_package_versions() -> Dict[str, str]:
     conda_exe = _conda_executable()
     if not conda_exe:
-        return None
+        return {}
 
     # If already in a conda environment, query the current environment
     env_name = None if _in_conda_environment() else _CONDA_ENV_NAME
 
     if env_name:
-        cmd = [conda_exe, "list", "-n", env_name, package, "--json"]
+        cmd = [conda_exe, "list", "-n", env_name, "--json"]
     else:
-        cmd = [conda_exe, "list", package, "--json"]
+        cmd = [conda_exe, "list", "--json"]
 
     result = subprocess.run(cmd, capture_output=True, text=True, check=False)
     if result.returncode != 0:
-        return None
+        return {}
     try:
         data = json.loads(result.stdout)
     except json.JSONDecodeError:
-        return None
-    for entry in data:
-        if entry.get("name") == package and entry.get("version"):
-            return entry["version"]
-    return None
+        return {}
+    return {
+        entry["name"]: entry["version"]
+        for entry in data
+        if entry.get("name") and entry.get("version")
+    }
+
+
+def _refresh_conda_cache() -> None:
+    _conda_package_versions.cache_clear()
+
+
+def _clear_probe_caches() -> None:
+    # Installs change what's on PATH, in site-packages and in the conda env
+    importlib.invalidate_caches()
+    _which_cached.cache_clear()
+    _conda_executable.cache_clear()
+    _installed_versions.cache_clear()
+    _refresh_conda_cache()
+
+
+def _conda_package_version(package: str) -> Optional[str]:
+    with _conda_list_lock:
+        versions = _conda_package_versions()
+    return versions.get(package)
 
 
 def _check_conda() -> List[str]:
@@ -283,34 +430,57 @@ def _vina_binary_path(repo_root: Path) -> Path:
 
 
 def _detect_version_from_output(output: str) -> Optional[str]:
-    match = re.search(r"(\d+\.\d+\.\d+)", output)
+    match = _VERSION_IN_OUTPUT_RE.search(output)
     if match:
         return match.group(1)
     return None
 
 
+_VERSION_FLAGS = ("--version", "--help", "-V", "-version")
+
+# Flag that last produced a version for each command; later probes try it alone
+_VERSION_FLAG_CACHE: Dict[str, str] = {}
+
+
+def _probe_version(args: List[str]) -> Optional[str]:
+    # Tools print their version on either stream; one merged pipe is enough, and
+    # the version line is ASCII so the bytes skip locale-aware decoding
+    try:
+        proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    except Exception:
+        return None
+    try:
+        output, _ = proc.communicate(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        # Don't drain the pipe: a grandchild may still hold it open
+        proc.wait()
+        proc.stdout.close()
+        return None
+    if proc.returncode != 0:
+        return None
+    return _detect_version_from_output(output.decode("ascii", "ignore"))
+
+
 def _detect_command_version(command: str) -> Optional[str]:
-    for args in (
-        [command, "--version"],
-        [command, "--help"],
-        [command, "-V"],
-        [command, "-version"],
-    ):
-        try:
-            result = subprocess.run(
-                args,
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-        except Exception:
-            continue
-        if result.returncode != 0:
-            continue
-        output = (result.stdout or "") + (result.stderr or "")
-        version = _detect_version_from_output(output)
+    # Nearly every tool answers --version (or the flag that worked last time),
+    # so that one runs alone before any fallback process is started
+    first_flag = _VERSION_FLAG_CACHE.get(command, _VERSION_FLAGS[0])
+    version = _probe_version([command, first_flag])
+    if version:
+        _VERSION_FLAG_CACHE[command] = first_flag
+        return version
+
+    # Probe the remaining flags concurrently, but take answers in _VERSION_FLAGS
+    # order: --help text can mention other x.y.z numbers, so it only counts once
+    # --version has failed. The pool is joined here, so no probe outlives the
+    # call (each is bounded by its own timeout)
+    fallback_flags = [flag for flag in _VERSION_FLAGS if flag != first_flag]
+    with ThreadPoolExecutor(max_workers=len(fallback_flags)) as executor:
+        versions = list(executor.map(lambda flag: _probe_version([command, flag]), fallback_flags))
+    for flag, version in zip(fallback_flags, versions):
         if version:
+            _VERSION_FLAG_CACHE[command] = flag
             return version
     return None
 
@@ -342,7 +512,7 @@ def _check_obabel() -> List[str]:
 
     # If not from conda, try to detect from binary
     if not version:
-        if not (Path(obabel_exe).exists() or shutil.which(obabel_exe)):
+        if not (Path(obabel_exe).exists() or _which_cached(obabel_exe)):
             issues.append("OpenBabel executable not found. Set OBABEL_EXE or add to PATH.")
             return issues
         version = _detect_command_version(obabel_exe)
@@ -360,9 +530,13 @@ def _check_obabel() -> List[str]:
 def _check_pdbfixer() -> List[str]:
     issues: List[str] = []
     pdbfixer_exe = os.environ.get("PDBFIXER_EXE", "pdbfixer")
-    if not (Path(pdbfixer_exe).exists() or shutil.which(pdbfixer_exe)):
+    if not (Path(pdbfixer_exe).exists() or _which_cached(pdbfixer_exe)):
         try:
-            version = _conda_package_version("pdbfixer")
+            version = (
+                _installed_versions().get("pdbfixer")
+                or _conda_env_dist_version("pdbfixer")
+                or _conda_package_version("pdbfixer")
+            )
             if not version:
                 result = _conda_run(
                     ["python", "-c", "import pdbfixer; print(pdbfixer.__version__)"]
@@ -375,10 +549,8 @@ def _check_pdbfixer() -> List[str]:
             issues.append("PDBFixer executable not found. Install pdbfixer or add to PATH.")
             return issues
     else:
-        version = None
-        try:
-            version = metadata.version("pdbfixer")
-        except metadata.PackageNotFoundError:
+        version = _installed_versions().get("pdbfixer")
+        if version is None:
             version = _detect_command_version(pdbfixer_exe)
 
     required = _REQUIRED_BINARIES["pdbfixer"]
@@ -391,35 +563,65 @@ def _check_pdbfixer() -> List[str]:
     return issues
 
 
-def ensure_dependencies() -> None:
+def _collect_issues(repo_root: Path, pyproject_path: Path) -> List[str]:
+    # The conda/binary probes spend their time waiting on subprocesses, so run them
+    # side by side while the in-process checks execute; report in a fixed order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        conda = executor.submit(_check_conda)
+        probes = [
+            executor.submit(_check_vina, repo_root),
+            executor.submit(_check_obabel),
+            executor.submit(_check_pdbfixer),
+        ]
+        issues: List[str] = []
+        dep_map = _dependency_map(pyproject_path) if pyproject_path.exists() else None
+        manifest_issues = _check_manifest_in_pyproject(pyproject_path, dep_map)
+        python_issues = _check_python_dependencies()
+        issues.extend(conda.result())
+        issues.extend(manifest_issues)
+        issues.extend(python_issues)
+        for probe in probes:
+            issues.extend(probe.result())
+    return issues
+
+
+def _deps_marker_valid() -> bool:
+    # Reinstalling the package rewrites this module, which invalidates the marker
+    try:
+        return _DEPS_MARKER.stat().st_mtime >= Path(__file__).stat().st_mtime
+    except OSError:
+        return False
+
+
+def ensure_dependencies(recheck: bool = False) -> None:
+    if not recheck and _deps_marker_valid():
+        return
+
     repo_root = find_repo_root(Path(__file__).resolve())
     pyproject_path = repo_root / "pyproject.toml"
 
-    issues: List[str] = []
-    issues.extend(_check_conda())
-    issues.extend(_check_manifest_in_pyproject(pyproject_path))
-    issues.extend(_check_python_dependencies())
-
-    issues.extend(_check_vina(repo_root))
-    issues.extend(_check_obabel())
-    issues.extend(_check_pdbfixer())
+    issues = _collect_issues(repo_root, pyproject_path)
 
     if issues:
         details = "\n".join(f"- {issue}" for issue in issues)
         raise RuntimeError(f"Dependency check failed:\n{details}")
 
+    _mark_dependencies_ok()
+
+
+def _mark_dependencies_ok() -> None:
+    try:
+        _DEPS_MARKER.parent.mkdir(parents=True, exist_ok=True)
+        _DEPS_MARKER.touch()
+    except OSError:
+        pass
+
 
 def build_dependencies(*, install_python: bool = True, quiet: bool = False) -> None:
     repo_root = find_repo_root(Path(__file__).resolve())
     pyproject_path = repo_root / "pyproject.toml"
 
-    issues: List[str] = []
-    issues.extend(_check_conda())
-    issues.extend(_check_manifest_in_pyproject(pyproject_path))
-    issues.extend(_check_python_dependencies())
-    issues.extend(_check_vina(repo_root))
-    issues.extend(_check_obabel())
-    issues.extend(_check_pdbfixer())
+    issues = _collect_issues(repo_root, pyproject_path)
 
     if not issues:
         if not quiet:
@@ -432,6 +634,15 @@ def build_dependencies(*, install_python: bool = True, quiet: bool = False) -> N
 
     _install_with_conda(["openbabel", "pdbfixer"])
 
+    # Re-check against fresh probes; only what the installs didn't fix is reported
+    _clear_probe_caches()
+    issues = _collect_issues(repo_root, pyproject_path)
+    if not issues:
+        _mark_dependencies_ok()
+        if not quiet:
+            print("Dependency check: PASS (after build)")
+        return
+
     hints = _binary_install_hints(repo_root)
     details = "\n".join(f"- {issue}" for issue in issues)
     hint_text = "\n".join(f"- {hint}" for hint in hints)
@@ -6,20 +6,28 @@ import logging
 import sys
 from typing import Optional
 
+PACKAGE_LOGGER = "autoscan"
+logging.getLogger(PACKAGE_LOGGER).setLevel(logging.INFO)
 
-def get_logger(name: str, level: str = "INFO") -> logging.Logger:
+
+def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     """
     Get a configured logger instance.
 
+    Module loggers under the package inherit their level from the "autoscan"
+    logger (INFO unless changed), so one setLevel() there covers them all.
+
     Args:
         name: Logger name (typically __name__).
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
+        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL). Defaults to
+            the package level, or INFO for loggers outside the package.
 
     Returns:
         Configured logger instance.
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    if level is not None or not name.startswith(PACKAGE_LOGGER + "."):
+        logger.setLevel(getattr(logging, (level or "INFO").upper()))
 
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
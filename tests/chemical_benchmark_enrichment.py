@@ -13,14 +13,21 @@ Enrichment Factor (EF) = (# Active in Top N% / # Actives Total) / (N% / 100%)
 Success: Ciprofloxacin ranks <= 3 (Top ~5% of 51 molecules)
 """
 
+import argparse
+import functools
 import os
 import sys
+import shutil
 import subprocess
+import tempfile
 import logging
+import logging.handlers
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from Bio.PDB import PDBParser, PDBIO, Select
 
@@ -29,6 +36,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from autoscan.docking.vina import VinaEngine
 from autoscan.docking.utils import calculate_grid_box
 
+# Sibling benchmark script: its obabel conversion and PDBQT cache are reused,
+# so both scripts share one cache directory and key scheme
+from benchmark_suite import pdb_to_pdbqt_batch
+
 # ============================================================================
 # Configuration
 # ============================================================================
@@ -108,19 +119,43 @@ REPORT_FILE = Path(__file__).parent.parent / "Test_Report_Phase_2.md"
 CSV_FILE = WORK_DIR / "enrichment_results.csv"
 LOG_FILE = WORK_DIR / "enrichment_benchmark.log"
 
+# PDBQT record prefixes for the line filters (tuple startswith, see benchmark_suite)
+_ATOM_RECORDS = (b"ATOM", b"HETATM")
+_RECEPTOR_RECORDS = (b"REMARK", *_ATOM_RECORDS)
+
 # ============================================================================
 # Logging Setup
 # ============================================================================
 
-WORK_DIR.mkdir(parents=True, exist_ok=True)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(asctime)s] %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler(LOG_FILE), logging.StreamHandler()],
-)
 logger = logging.getLogger(__name__)
 
+
+def _setup_logging() -> None:
+    """
+    Create this run's WORK_DIR and log to its LOG_FILE and the console.
+
+    Called from main() only, so spawned workers re-importing this module do
+    not each create a workspace directory and log file of their own.
+    """
+    WORK_DIR.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(asctime)s] %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.FileHandler(LOG_FILE), logging.StreamHandler()],
+    )
+
+
+# Shared Bio.PDB helpers; both are safe to reuse across targets
+_PDB_PARSER = PDBParser(QUIET=True)
+_PDB_IO = PDBIO()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_structure(pdb_path: str):
+    """Parse a PDB file once; the ligand and receptor extractors share the result."""
+    return _PDB_PARSER.get_structure(Path(pdb_path).stem, pdb_path)
+
+
 # ============================================================================
 # Helper Classes & Functions
 # ============================================================================
@@ -137,19 +172,18 @@ class CrystalLigandSelector(Select):
         return resname == self.ligand_code
 
 
+_SOLVENT_ION_RESNAMES = frozenset({"HOH", "WAT", "CL", "NA", "MG", "CA", "ZN"})
+
+
 class ReceptorSelector(Select):
     """Select receptor atoms (exclude ligand and water)."""
 
     def __init__(self, lig_resname: str):
         self.lig_resname = lig_resname.strip().upper()
+        self._exclude = _SOLVENT_ION_RESNAMES | {self.lig_resname}
 
     def accept_residue(self, residue):
-        resname = residue.get_resname().strip().upper()
-        if resname == self.lig_resname:
-            return False
-        if resname in ["HOH", "WAT", "CL", "NA", "MG", "CA", "ZN"]:
-            return False
-        return True
+        return residue.get_resname().strip().upper() not in self._exclude
 
 
 def generate_pdbqt_from_smiles(
@@ -239,8 +273,81 @@ def generate_pdbqt_from_smiles(
         return None
 
 
+def generate_pdbqt_batch(entries: List[Tuple[str, str, Path]], ph: float = 7.4) -> Dict[str, Path]:
+    """
+    Generate 3D PDBQTs for many SMILES with two obabel launches in total.
+
+    Args:
+        entries: (name, smiles, output_path) per molecule; names must be unique
+            single tokens, since they are matched back from obabel's output
+        ph: pH for protonation
+
+    Returns:
+        Mapping of name to PDBQT path. Molecules the batch could not produce
+        are retried one at a time with generate_pdbqt_from_smiles.
+    """
+    generated: Dict[str, Path] = {}
+    outputs = {name: output_path for name, _, output_path in entries}
+    try:
+        with tempfile.TemporaryDirectory(prefix="obabel_smiles_") as tmp:
+            tmp_dir = Path(tmp)
+            smiles_file = tmp_dir / "batch.smi"
+            smiles_file.write_text("".join(f"{smiles} {name}\n" for name, smiles, _ in entries))
+
+            # SDF keeps each molecule's title, which maps the split outputs back
+            sdf_file = tmp_dir / "batch.sdf"
+            cmd_gen3d = [
+                "obabel",
+                str(smiles_file),
+                "-O",
+                str(sdf_file),
+                "--gen3d",
+                "-h",
+                f"-p{ph}",
+            ]
+            timeout = 30 * len(entries)
+            result = subprocess.run(cmd_gen3d, capture_output=True, text=True, timeout=timeout)
+            if result.returncode == 0 and sdf_file.exists():
+                cmd_pdbqt = [
+                    "obabel",
+                    str(sdf_file),
+                    f"-O{tmp_dir / 'out.pdbqt'}",
+                    "-m",
+                    "-xr",
+                    "--partialcharge",
+                    "gasteiger",
+                ]
+                subprocess.run(cmd_pdbqt, capture_output=True, text=True, timeout=timeout)
+
+            for pdbqt in tmp_dir.glob("out*.pdbqt"):
+                content = pdbqt.read_text()
+                name = None
+                for line in content.splitlines():
+                    if line.startswith("REMARK") and "Name =" in line:
+                        name = line.split("Name =", 1)[1].strip()
+                        break
+                if name not in outputs or name in generated:
+                    continue
+                if "ATOM" not in content and "HETATM" not in content:
+                    continue
+                shutil.move(str(pdbqt), str(outputs[name]))
+                generated[name] = outputs[name]
+                logger.info(f"✓ Generated PDBQT for {name} ({len(content)} bytes)")
+    except subprocess.TimeoutExpired:
+        logger.warning("obabel batch timeout; generating remaining molecules one by one")
+    except Exception as e:
+        logger.warning(f"Batch PDBQT generation failed: {e}")
+
+    for name, smiles, output_path in entries:
+        if name not in generated:
+            result = generate_pdbqt_from_smiles(name, smiles, output_path, ph)
+            if result:
+                generated[name] = result
+    return generated
+
+
 def extract_crystal_ligand_box(
-    pdb_file: Path, ligand_code: str
+    pdb_file: Path, ligand_code: str, structure=None
 ) -> Tuple[Optional[Path], Optional[np.ndarray]]:
     """
     Extract crystal ligand from PDB to define grid box.
@@ -249,30 +356,25 @@ def extract_crystal_ligand_box(
         (ligand_pdbqt_path, center_coords)
     """
     try:
-        parser = PDBParser(QUIET=True)
-        structure = parser.get_structure("crystal", str(pdb_file))
+        if structure is None:
+            structure = _load_structure(str(pdb_file))
 
         output_pdb = WORK_DIR / "crystal_ligand.pdb"
         output_pdbqt = WORK_DIR / "crystal_ligand.pdbqt"
 
         # Save ligand
-        io = PDBIO()
-        io.set_structure(structure)
-        io.save(str(output_pdb), CrystalLigandSelector(ligand_code))
+        _PDB_IO.set_structure(structure)
+        _PDB_IO.save(str(output_pdb), CrystalLigandSelector(ligand_code))
+
+        # The extraction doubles as the existence check: PDBIO writes only the
+        # END record when the selector matched nothing, so skip obabel then
+        ligand_records = output_pdb.read_bytes()
+        if b"HETATM" not in ligand_records and b"ATOM" not in ligand_records:
+            logger.warning(f"Crystal ligand {ligand_code} not found in {pdb_file.name}")
+            return None, None
 
         # Convert to PDBQT
-        cmd = [
-            "obabel",
-            str(output_pdb),
-            f"-O{output_pdbqt}",
-            "-xr",
-            "-h",
-            "-p7.4",
-            "--partialcharge",
-            "gasteiger",
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
+        if not pdb_to_pdbqt_batch([(output_pdb, output_pdbqt)])[0]:
             logger.warning(f"Crystal ligand conversion failed")
             return None, None
 
@@ -303,40 +405,31 @@ def extract_crystal_ligand_box(
         return None, None
 
 
-def extract_receptor(pdb_file: Path, ligand_code: str) -> Optional[Path]:
+def extract_receptor(pdb_file: Path, ligand_code: str, structure=None) -> Optional[Path]:
     """Extract receptor from PDB and convert to PDBQT."""
     try:
-        parser = PDBParser(QUIET=True)
-        structure = parser.get_structure("receptor", str(pdb_file))
+        if structure is None:
+            structure = _load_structure(str(pdb_file))
 
         output_pdb = WORK_DIR / "receptor.pdb"
         output_pdbqt = WORK_DIR / "receptor.pdbqt"
 
         # Save receptor
-        io = PDBIO()
-        io.set_structure(structure)
-        io.save(str(output_pdb), ReceptorSelector(ligand_code))
+        _PDB_IO.set_structure(structure)
+        _PDB_IO.save(str(output_pdb), ReceptorSelector(ligand_code))
 
         # Convert to PDBQT
-        cmd = [
-            "obabel",
-            str(output_pdb),
-            f"-O{output_pdbqt}",
-            "-xr",
-            "-h",
-            "-p7.4",
-            "--partialcharge",
-            "gasteiger",
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
+        if not pdb_to_pdbqt_batch([(output_pdb, output_pdbqt)])[0]:
             logger.warning(f"Receptor conversion failed")
             return None
 
-        # Strip BRANCH/ROOT tags from receptor
-        lines = output_pdbqt.read_text().splitlines()
-        cleaned = [line for line in lines if line.startswith(("REMARK", "ATOM", "HETATM"))]
-        output_pdbqt.write_text("\n".join(cleaned) + "\n")
+        # Strip BRANCH/ROOT tags from receptor, streaming through a temp file
+        tmp_pdbqt = output_pdbqt.with_name(output_pdbqt.name + ".tmp")
+        with open(output_pdbqt, "rb") as fin, open(tmp_pdbqt, "wb") as fout:
+            for line in fin:
+                if line.startswith(_RECEPTOR_RECORDS):
+                    fout.write(line)
+        os.replace(tmp_pdbqt, output_pdbqt)
 
         logger.info(f"✓ Receptor extracted and converted")
         return output_pdbqt
@@ -348,63 +441,100 @@ def extract_receptor(pdb_file: Path, ligand_code: str) -> Optional[Path]:
 
 def ensure_pdbqt_ligand(pdbqt_path: Path) -> None:
     """Wrap ligand PDBQT with ROOT/ENDROOT tags."""
-    lines = pdbqt_path.read_text().splitlines()
-    if any(line.startswith("ROOT") for line in lines):
+    raw = pdbqt_path.read_bytes()
+    # Already wrapped: one C-level substring search instead of splitting every line
+    if raw.startswith(b"ROOT") or b"\nROOT" in raw:
         return
 
-    remarks = [line for line in lines if line.startswith("REMARK")]
-    atoms = [line for line in lines if line.startswith(("ATOM", "HETATM"))]
+    remarks = []
+    atoms = []
+    for line in raw.splitlines():
+        if line.startswith(b"REMARK"):
+            remarks.append(line)
+        elif line.startswith(_ATOM_RECORDS):
+            atoms.append(line)
     if atoms:
-        wrapped = remarks + ["ROOT"] + atoms + ["ENDROOT", "TORSDOF 0"]
-        pdbqt_path.write_text("\n".join(wrapped) + "\n")
-
-
-def dock_molecule(
-    receptor_pdbqt: Path, ligand_pdbqt: Path, center: np.ndarray, exhaustiveness: int = 16
-) -> Optional[float]:
-    """Dock ligand into receptor."""
-    try:
-        if not ligand_pdbqt.exists():
-            return None
-
-        ensure_pdbqt_ligand(ligand_pdbqt)
-
-        output_pdbqt = ligand_pdbqt.with_stem(ligand_pdbqt.stem + "_docked")
-
-        import platform
-        # Dynamically detect OS to prevent .exe crashes in Docker
-        if platform.system() == "Windows":
-            vina_exec = "tools/vina.exe"
-        else:
-            vina_exec = "vina"
+        wrapped = remarks + [b"ROOT"] + atoms + [b"ENDROOT", b"TORSDOF 0"]
+        pdbqt_path.write_bytes(b"\n".join(wrapped) + b"\n")
 
-        engine = VinaEngine(
-            receptor_pdbqt=str(receptor_pdbqt),
-            ligand_pdbqt=str(ligand_pdbqt),
-            vina_executable=vina_exec,
-        )
-
-        result = engine.run(
-            center=center.tolist(),
-            buffer_angstroms=15.0,
-            cpu=4,
-            num_modes=9,
-            exhaustiveness=exhaustiveness,
-            output_pdbqt=str(output_pdbqt),
-        )
 
-        # Extract binding affinity from DockingResult object
-        score = result.binding_affinity if result else None
-
-        if score is None or score > 100 or score < -200:
-            logger.warning(f"Energy anomaly: {score}")
-            return 999.9
+def dock_molecules(
+    receptor_pdbqt: Path,
+    ligand_pdbqts: List[Path],
+    center: np.ndarray,
+    exhaustiveness: int = 16,
+    cpu: int = 4,
+) -> List[Optional[float]]:
+    """
+    Dock ligands into one receptor box, setting the receptor up only once.
 
-        return score
+    Goes through VinaEngine.run_batch, so the receptor is loaded and its grid
+    maps computed a single time for the whole list. A molecule that fails to
+    dock is scored None and the batch resumes with the ones after it.
+    Module-level so worker processes can pickle it.
 
-    except Exception as e:
-        logger.error(f"Docking error: {e}")
-        return None
+    Returns:
+        Scores in input order (None where docking failed).
+    """
+    scores: Dict[Path, Optional[float]] = {}
+    remaining = []
+    for ligand in ligand_pdbqts:
+        try:
+            if ligand.exists():
+                ensure_pdbqt_ligand(ligand)
+                remaining.append(ligand)
+        except OSError as e:
+            logger.error(f"Docking error for {ligand.name}: {e}")
+
+    import platform
+    # Dynamically detect OS to prevent .exe crashes in Docker
+    if platform.system() == "Windows":
+        vina_exec = "tools/vina.exe"
+    else:
+        vina_exec = "vina"
+
+    if remaining:
+        try:
+            engine = VinaEngine(receptor_pdbqt=str(receptor_pdbqt), vina_executable=vina_exec)
+        except Exception as e:
+            logger.error(f"Docking error: {e}")
+            remaining = []
+
+    while remaining:
+        try:
+            results = engine.run_batch(
+                [str(ligand) for ligand in remaining],
+                center=center.tolist(),
+                buffer_angstroms=15.0,
+                cpu=cpu,
+                num_modes=9,
+                exhaustiveness=exhaustiveness,
+            )
+            for ligand, result in zip(remaining, results):
+                # Extract binding affinity from DockingResult object
+                score = result.binding_affinity if result else None
+                if score is None or score > 100 or score < -200:
+                    logger.warning(f"Energy anomaly: {score}")
+                    score = 999.9
+                scores[ligand] = score
+            break
+        except Exception as e:
+            # run_batch stops at the first failure: that is the next unscored ligand
+            failed = next(ligand for ligand in remaining if ligand not in scores)
+            logger.error(f"Docking error for {failed.name}: {e}")
+            scores[failed] = None
+            remaining = [ligand for ligand in remaining if ligand not in scores]
+
+    return [scores.get(ligand) for ligand in ligand_pdbqts]
+
+
+def _init_worker(log_queue) -> None:
+    """Route a worker's log records to the parent, which owns the log file."""
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
 
 
 # ============================================================================
@@ -412,8 +542,14 @@ def dock_molecule(
 # ============================================================================
 
 
-def run_enrichment_benchmark():
-    """Execute the Police Lineup test."""
+def run_enrichment_benchmark(workers: int = 0):
+    """
+    Execute the Police Lineup test.
+
+    Args:
+        workers: Molecules docked in parallel (0 = half the CPU count). With more
+            than one worker each Vina run gets a single thread.
+    """
 
     logger.info("=" * 80)
     logger.info("Test Suite 2: Chemical Enrichment Benchmark - 'The Police Lineup'")
@@ -430,8 +566,13 @@ def run_enrichment_benchmark():
 
     # Extract crystal ligand (to define box) and receptor
     logger.info("\n[1/4] Extracting crystal ligand and receptor...")
-    crystal_pdbqt, center = extract_crystal_ligand_box(pdb_file, "CPF")
-    receptor_pdbqt = extract_receptor(pdb_file, "CPF")
+    try:
+        structure = _load_structure(str(pdb_file))
+    except Exception as e:
+        logger.error(f"Failed to parse {pdb_file}: {e}")
+        return None
+    crystal_pdbqt, center = extract_crystal_ligand_box(pdb_file, "CPF", structure)
+    receptor_pdbqt = extract_receptor(pdb_file, "CPF", structure)
 
     if receptor_pdbqt is None or center is None:
         logger.error("Failed to extract receptor or ligand")
@@ -441,22 +582,27 @@ def run_enrichment_benchmark():
     logger.info("\n[2/4] Generating 3D PDBQTs from SMILES...")
     molecules = {}
 
+    entries = [("Ciprofloxacin", ACTIVE_SMILES, WORK_DIR / "active_ciprofloxacin.pdbqt")]
+    for i, smiles in enumerate(DECOY_SMILES, 1):
+        decoy_name = f"Decoy_{i:02d}"
+        entries.append((decoy_name, smiles, WORK_DIR / f"{decoy_name}.pdbqt"))
+    generated = generate_pdbqt_batch(entries)
+
     # Active
-    active_pdbqt = WORK_DIR / "active_ciprofloxacin.pdbqt"
-    result = generate_pdbqt_from_smiles("Ciprofloxacin", ACTIVE_SMILES, active_pdbqt)
-    if result:
-        molecules["Ciprofloxacin"] = {"type": "Active", "pdbqt": result, "smiles": ACTIVE_SMILES}
+    if "Ciprofloxacin" in generated:
+        molecules["Ciprofloxacin"] = {
+            "type": "Active",
+            "pdbqt": generated["Ciprofloxacin"],
+            "smiles": ACTIVE_SMILES,
+        }
     else:
         logger.error("Failed to generate Active ligand")
         return None
 
     # Decoys
-    for i, smiles in enumerate(DECOY_SMILES, 1):
-        decoy_name = f"Decoy_{i:02d}"
-        decoy_pdbqt = WORK_DIR / f"{decoy_name}.pdbqt"
-        result = generate_pdbqt_from_smiles(decoy_name, smiles, decoy_pdbqt)
-        if result:
-            molecules[decoy_name] = {"type": "Decoy", "pdbqt": result, "smiles": smiles}
+    for name, smiles, _ in entries[1:]:
+        if name in generated:
+            molecules[name] = {"type": "Decoy", "pdbqt": generated[name], "smiles": smiles}
 
     logger.info(f"✓ Generated {len(molecules)} molecules ({len(molecules)-1} decoys + 1 active)")
 
@@ -464,18 +610,61 @@ def run_enrichment_benchmark():
     logger.info(f"\n[3/4] Docking all {len(molecules)} molecules...")
     results = []
 
-    for i, (name, data) in enumerate(molecules.items(), 1):
-        logger.info(f"  [{i}/{len(molecules)}] Docking {name}...")
-
-        score = dock_molecule(receptor_pdbqt, data["pdbqt"], center, exhaustiveness=16)
-
+    if workers <= 0:
+        workers = max(1, (os.cpu_count() or 1) // 2)
+    workers = min(workers, len(molecules))
+
+    # Each worker docks its own share of the molecules as one batch, so
+    # receptor maps are built once per worker rather than once per molecule
+    names = list(molecules)
+    scores: Dict[str, Optional[float]] = {}
+    if workers == 1:
+        batch = dock_molecules(
+            receptor_pdbqt, [molecules[name]["pdbqt"] for name in names], center, 16
+        )
+        scores.update(zip(names, batch))
+    else:
+        # Workers log through a queue so the parent's handlers stay the only
+        # writers of the log file
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(
+            log_queue, *logging.getLogger().handlers, respect_handler_level=True
+        )
+        listener.start()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(log_queue,)
+            ) as executor:
+                # Interleaved shares keep the workers' loads even
+                shares = [names[k::workers] for k in range(workers)]
+                futures = {
+                    executor.submit(
+                        dock_molecules,
+                        receptor_pdbqt,
+                        [molecules[name]["pdbqt"] for name in share],
+                        center,
+                        16,
+                        1,
+                    ): share
+                    for share in shares
+                }
+                for future in as_completed(futures):
+                    share = futures[future]
+                    scores.update(zip(share, future.result()))
+                    logger.info(f"  [{len(scores)}/{len(molecules)}] molecules docked")
+        finally:
+            listener.stop()
+
+    # Collect in input order so ties rank the same however docking was scheduled
+    for name, data in molecules.items():
+        score = scores[name]
         if score is not None:
             results.append(
                 {"Name": name, "Type": data["type"], "Energy": score, "SMILES": data["smiles"]}
             )
-            logger.info(f"      → Affinity: {score:.2f} kcal/mol")
+            logger.info(f"      → {name} affinity: {score:.2f} kcal/mol")
         else:
-            logger.warning(f"      → Docking failed")
+            logger.warning(f"      → {name} docking failed")
 
     if not results:
         logger.error("No successful dockings")
@@ -723,11 +912,21 @@ Based on this test:
 
 def main():
     """Main execution."""
+    parser = argparse.ArgumentParser(description="AutoScan Chemical Enrichment Benchmark")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Molecules to dock in parallel, one Vina thread each (default: half the CPU count)",
+    )
+    args = parser.parse_args()
+    _setup_logging()
+
     print("\n" + "=" * 80)
     print("AutoScan Test Suite 2: Chemical Enrichment Benchmark")
     print("=" * 80 + "\n")
 
-    results = run_enrichment_benchmark()
+    results = run_enrichment_benchmark(workers=args.workers)
 
     if results:
         generate_report(results)